@@ -0,0 +1,49 @@
+"""Check which cover URL _extract_picture_url picks from s.to cards.
+
+Usage:
+    python scripts/test_sto_picture_url.py
+"""
+
+from bs4 import BeautifulSoup
+
+from aniworld.sites.s_to import S_TO, _extract_picture_url
+
+
+def _card(html: str):
+    return BeautifulSoup(f"<article>{html}</article>", "html.parser").article
+
+
+def test_img_wins_over_picture_source():
+    card = _card(
+        "<picture>"
+        '<source srcset="/img/cover.webp 1x, /img/cover@2x.webp 2x">'
+        '<img src="/img/cover.jpg">'
+        "</picture>"
+    )
+    assert _extract_picture_url(card) == S_TO + "/img/cover.jpg"
+
+
+def test_source_used_when_img_is_placeholder():
+    card = _card(
+        "<picture>"
+        '<source data-srcset="https://cdn.example/cover.webp 1x">'
+        '<img src="data:image/gif;base64,R0lGOD">'
+        "</picture>"
+    )
+    assert _extract_picture_url(card) == "https://cdn.example/cover.webp"
+
+
+def test_lazy_img_data_src():
+    card = _card('<img data-src="/img/lazy.jpg">')
+    assert _extract_picture_url(card) == S_TO + "/img/lazy.jpg"
+
+
+def test_no_image():
+    assert _extract_picture_url(_card("<h3>No cover</h3>")) == ""
+
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            fn()
+            print(f"{name}: ok")
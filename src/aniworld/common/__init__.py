@@ -1,4 +1,5 @@
 from .common import (
+    clear_series_cache as clear_series_cache,
     generate_links as generate_links,
     get_episode_titles as get_episode_titles,
     get_movie_episode_count as get_movie_episode_count,
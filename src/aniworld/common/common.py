@@ -110,6 +110,23 @@ def get_episode_titles(
     return result
 
 
+def clear_series_cache(slug: str, link: str = ANIWORLD_TO) -> None:
+    """
+    Forget cached season counts, episode titles and movie count for a series.
+    Dispatches to the correct site module based on the link.
+
+    Args:
+        slug: Anime/series slug from URL
+        link: Base URL used to detect the site
+    """
+    for prefix in ("seasons", "titles", "movies"):
+        _ANIME_DATA_CACHE.pop(f"{prefix}_{slug}", None)
+
+    if S_TO in link:
+        from ..sites.s_to import clear_sto_series_cache
+        clear_sto_series_cache(slug)
+
+
 def _natural_sort_key(link_url: str) -> List:
     """Natural sort key for URLs."""
     return [
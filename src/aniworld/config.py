@@ -256,6 +256,11 @@ DEFAULT_PROVIDER = "VOE"
 DEFAULT_MAX_CONCURRENT_DOWNLOADS = 5
 # Seconds to wait per provider when auto-selecting
 DEFAULT_PROVIDER_TIMEOUT = 5
+# Seconds the web interface reuses a series' scraped episode list
+EPISODES_CACHE_TTL = 600
+# Visit folders in on-disk order when counting videos for the web file
+# browser (Linux FIEMAP; mainly helps spinning disks)
+FILES_FIEMAP_ORDER = False
 
 # https://learn.microsoft.com/en-us/windows/win32/fileio/naming-a-file
 INVALID_PATH_CHARS = ("<", ">", ":", '"', "/", "\\", "|", "?", "*", "&")
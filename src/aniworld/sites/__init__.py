@@ -20,8 +20,15 @@ from .s_to import (
     fetch_sto_search_results,
     get_season_episode_count as sto_get_season_episode_count,
     get_movie_episode_count as sto_get_movie_episode_count,
+    get_season_info as sto_get_season_info,
+)
+from .movie4k import (
+    Movie,
+    MovieAnime,
+    is_movie4k_url,
+    fetch_movie4k_search_results,
+    resolve_direct_links as movie4k_resolve_direct_links,
 )
-from .movie4k import Movie, MovieAnime, is_movie4k_url, fetch_movie4k_search_results
 from .huhu import HuhuMovie, HuhuMovieAnime, is_huhu_url, fetch_huhu_search_results
 
 __all__ = [
@@ -34,10 +41,12 @@ __all__ = [
     "fetch_sto_search_results",
     "sto_get_season_episode_count",
     "sto_get_movie_episode_count",
+    "sto_get_season_info",
     "Movie",
     "MovieAnime",
     "is_movie4k_url",
     "fetch_movie4k_search_results",
+    "movie4k_resolve_direct_links",
     "HuhuMovie",
     "HuhuMovieAnime",
     "is_huhu_url",
@@ -13,13 +13,20 @@ The module provides:
 
 import importlib
 import inspect
+import json
 import logging
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
-from urllib.parse import urlparse, quote, urljoin
+from urllib.parse import urlparse, quote
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..config import (
     DEFAULT_REQUEST_TIMEOUT,
@@ -31,6 +38,11 @@ from ..config import (
 )
 from ..parser import get_arguments
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 
 # Provider name mappings from stream URLs to internal provider names
@@ -43,7 +55,87 @@ MOVIE4K_PROVIDER_MAPPING = {
     "voe": "VOE",
 }
 
+# O(1) membership checks; SUPPORTED_PROVIDERS itself is kept for ordering
+_SUPPORTED_PROVIDERS_SET = frozenset(SUPPORTED_PROVIDERS)
 
+# Single alternation over all mapping keys; longer keys come first in the
+# mapping ("doodstream" before "dood") so they win at the same position.
+_PROVIDER_RE = re.compile(
+    "|".join(re.escape(pattern) for pattern in MOVIE4K_PROVIDER_MAPPING),
+    re.IGNORECASE,
+)
+
+
+def _create_session() -> requests.Session:
+    """Create the pooled keep-alive session shared by all movie4k.sx requests."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=20,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+    )
+    session.mount("https://", adapter)
+    session.headers.update({"User-Agent": RANDOM_USER_AGENT})
+    return session
+
+
+# Every call goes to the same host, so reusing one session saves a TCP+TLS
+# handshake per request after the first.
+_SESSION = _create_session()
+
+# Shared worker pool for overlapping independent movie4k.sx requests. Sized
+# to stay within the session's connection pool so workers never wait on a
+# free connection.
+_IO_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="movie4k-io")
+
+# Static per-request header deltas on top of the session defaults. Dynamic
+# values such as a Referer are merged in at the call site.
+_JSON_HEADERS = {"Accept": "application/json"}
+
+# Must NOT include 'br' — requests cannot decode Brotli and the server
+# returns Brotli when 'br' is advertised, yielding an unreadable body.
+_API_HEADERS = {
+    "Accept": "application/json, text/plain, */*",
+    "Accept-Encoding": "gzip, deflate",
+    "Referer": f"{MOVIE4K_SX}/browse?c=movie&m=filter&order_by=Neu&lang=&type=movies",
+    "Sec-Fetch-Dest": "empty",
+    "Sec-Fetch-Mode": "cors",
+    "Sec-Fetch-Site": "same-origin",
+}
+
+# TMDB thumbnail base for listing covers; the API only returns the poster path
+_TMDB_PREFIX = "https://image.tmdb.org/t/p/w92"
+
+# Matches http(s) URLs whose host is (a subdomain of) movie4k.<tld>
+_MOVIE4K_HOST_RE = re.compile(r"^https?://(?:[^/]*\.)?movie4k\.", re.IGNORECASE)
+
+# Patterns used per title / per scraped link, compiled once at import time
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_YEAR_RE = re.compile(r"\((\d{4})\)")
+
+
+def _has_class_xpath(tag: str, css_class: str) -> etree.XPath:
+    """Compile an XPath selecting descendants of tag carrying css_class."""
+    return etree.XPath(
+        f'.//{tag}[contains(concat(" ", normalize-space(@class), " "), " {css_class} ")]'
+    )
+
+
+# XPath expressions for the browse scraper, compiled once at import time
+_WATCH_LINKS_XPATH = etree.XPath(
+    '//a[re:test(@href, "/watch/[^/]+/[a-f0-9]+")]',
+    namespaces={"re": "http://exslt.org/regular-expressions"},
+)
+_CARD_XPATH = etree.XPath("ancestor::*[self::div or self::article or self::li][1]")
+_HEADING_XPATH = etree.XPath("(.//h1|.//h2|.//h3|.//h4|.//h5|.//h6)[1]")
+_IMG_XPATH = etree.XPath("(.//img)[1]")
+_YEAR_SPAN_XPATH = _has_class_xpath("span", "year")
+_PRODUCTION_YEAR_XPATH = _has_class_xpath("*", "productionYear")
+_PARAGRAPH_XPATH = etree.XPath("(.//p)[1]")
+_DESCRIPTION_XPATH = _has_class_xpath("*", "description")
+
+
+@lru_cache(maxsize=1024)
 def _extract_provider_from_url(url: str) -> Optional[str]:
     """
     Extract provider name from a streaming URL.
@@ -54,24 +146,27 @@ def _extract_provider_from_url(url: str) -> Optional[str]:
     Returns:
         Provider name or None if not recognized
     """
-    url_lower = url.lower()
-    for pattern, provider in MOVIE4K_PROVIDER_MAPPING.items():
-        if pattern in url_lower:
-            return provider
-    return None
+    match = _PROVIDER_RE.search(url)
+    return MOVIE4K_PROVIDER_MAPPING[match.group(0).lower()] if match else None
 
 
+@lru_cache(maxsize=4096)
 def _title_to_slug(title: str) -> str:
     """Convert a movie title to a URL slug.
 
     Example: "Greenland *ENGLISH*" -> "greenland-english"
     """
     # Lowercase and replace non-alphanumeric chars with hyphens
-    slug = re.sub(r"[^a-z0-9]+", "-", title.lower())
+    slug = _SLUG_RE.sub("-", title.lower())
     return slug.strip("-")
 
 
 
+def _text(element) -> str:
+    """Return the stripped text of an lxml element, like BeautifulSoup's get_text(strip=True)."""
+    return "".join(part.strip() for part in element.itertext())
+
+
 def _scrape_browse_results(keyword: str) -> List[Dict]:
     """
     Scrape movie4k.sx HTML browse/search page as a fallback.
@@ -82,22 +177,35 @@ def _scrape_browse_results(keyword: str) -> List[Dict]:
     search_url = f"{MOVIE4K_SX}/browse?keyword={quote(keyword)}&type=movies"
     print("Scraping movie4k.sx HTML browse page:", search_url)
     try:
-        response = requests.get(
-            search_url,
-            timeout=DEFAULT_REQUEST_TIMEOUT,
-            headers={"User-Agent": RANDOM_USER_AGENT},
-        )
+        response = _SESSION.get(search_url, timeout=DEFAULT_REQUEST_TIMEOUT)
         response.raise_for_status()
     except requests.RequestException as err:
         logging.warning("movie4k.sx HTML browse request failed: %s", err)
         return []
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    # Hand the raw bytes to the parser with a known encoding instead of
+    # response.text, which would run charset detection and decode the
+    # whole body once before the parser decodes it again. movie4k.sx
+    # serves UTF-8; only trust response.encoding if the server sent an
+    # explicit charset (requests otherwise defaults text/html to latin-1).
+    content_type = response.headers.get("Content-Type", "").lower()
+    encoding = response.encoding if "charset=" in content_type else None
+    try:
+        # Walk the tree with lxml/XPath directly; the traversal stays in C
+        # instead of wrapping every visited node in a BeautifulSoup Tag.
+        tree = lxml_html.fromstring(
+            response.content,
+            parser=lxml_html.HTMLParser(encoding=encoding or "utf-8"),
+        )
+    except (etree.ParserError, ValueError) as err:
+        logging.warning("movie4k.sx HTML browse page could not be parsed: %s", err)
+        return []
+
     results = []
     seen_slugs = set()
 
     # Look for links matching /watch/{slug}/{id} pattern
-    watch_links = soup.find_all("a", href=re.compile(r"/watch/[^/]+/[a-f0-9]+"))
+    watch_links = _WATCH_LINKS_XPATH(tree)
 
     for link in watch_links:
         href = link.get("href", "")
@@ -116,50 +224,50 @@ def _scrape_browse_results(keyword: str) -> List[Dict]:
             continue
         seen_slugs.add(slug)
 
+        # Nearest enclosing card element, if any
+        parents = _CARD_XPATH(link)
+        parent = parents[0] if parents else None
+
         # Extract title from link text or parent context
         name = ""
-        parent = link.find_parent(["div", "article", "li"])
-        if parent:
-            h_tag = parent.find(["h1", "h2", "h3", "h4", "h5", "h6"])
-            if h_tag:
-                name = h_tag.get_text(strip=True)
+        if parent is not None:
+            h_tags = _HEADING_XPATH(parent)
+            if h_tags:
+                name = _text(h_tags[0])
         if not name:
             name = link.get("title", "")
         if not name:
-            name = link.get_text(strip=True)
+            name = _text(link)
         if not name:
             name = slug.replace("-", " ").title()
 
         # Extract cover image
         cover = ""
-        img_context = parent if parent else link
-        img = img_context.find("img")
-        if img:
-            cover = img.get("data-src") or img.get("src") or ""
+        img_context = parent if parent is not None else link
+        imgs = _IMG_XPATH(img_context)
+        if imgs:
+            cover = imgs[0].get("data-src") or imgs[0].get("src") or ""
             if cover and cover.startswith("/"):
                 cover = MOVIE4K_SX + cover
 
         # Extract year if present
         year = ""
-        if parent:
-            year_el = parent.find("span", class_="year") or parent.find(
-                class_="productionYear"
-            )
-            if year_el:
-                year = year_el.get_text(strip=True)
+        if parent is not None:
+            year_els = _YEAR_SPAN_XPATH(parent) or _PRODUCTION_YEAR_XPATH(parent)
+            if year_els:
+                year = _text(year_els[0])
             else:
                 # Try to find year in text like "(2024)"
-                text = parent.get_text()
-                year_match = re.search(r"\((\d{4})\)", text)
+                year_match = _YEAR_RE.search(parent.text_content())
                 if year_match:
                     year = year_match.group(1)
 
         # Extract description
         description = ""
-        if parent:
-            desc_el = parent.find("p") or parent.find(class_="description")
-            if desc_el:
-                description = desc_el.get_text(strip=True)
+        if parent is not None:
+            desc_els = _PARAGRAPH_XPATH(parent) or _DESCRIPTION_XPATH(parent)
+            if desc_els:
+                description = _text(desc_els[0])
 
         results.append({
             "name": name,
@@ -172,6 +280,49 @@ def _scrape_browse_results(keyword: str) -> List[Dict]:
     return results
 
 
+def _fetch_browse_list(order_by: str, key: str) -> List[Dict[str, str]]:
+    """Fetch one movie4k.sx browse listing (e.g. Trending, Neu) as card entries."""
+    api_url = (
+        f"{MOVIE4K_SX}/data/browse/"
+        f"?lang=2&keyword=&year=&networks=&rating=&votes="
+        f"&genre=&country=&cast=&directors="
+        f"&type=movies&order_by={order_by}&page=1&limit=20"
+    )
+    try:
+        resp = _SESSION.get(api_url, timeout=DEFAULT_REQUEST_TIMEOUT, headers=_API_HEADERS)
+        resp.raise_for_status()
+        data = _json_loads(resp.content)
+    except requests.RequestException as err:
+        logging.warning("fetch_popular_and_new_movie4k: request failed for %s: %s", key, err)
+        return []
+    except ValueError as err:
+        logging.warning("fetch_popular_and_new_movie4k: JSON parse failed for %s: %s", key, err)
+        return []
+
+    # The browse API wraps results in {"movies": [...]}; anything else
+    # (error objects, empty bodies) carries no listing.
+    movies = data.get("movies") if isinstance(data, dict) else None
+    if not isinstance(movies, list):
+        return []
+
+    # Bind loop-invariant values and methods to locals; this runs per item
+    watch_prefix = f"{MOVIE4K_SX}/watch/"
+    entries: List[Dict[str, str]] = []
+    append = entries.append
+    for m in movies:
+        get = m.get
+        title = get("title")
+        if not title:
+            continue
+        poster_path = get("poster_path")
+        append({
+            "name": title,
+            "cover": _TMDB_PREFIX + poster_path if poster_path else "",
+            "url": f"{watch_prefix}{_title_to_slug(title)}/{get('_id', '')}",
+        })
+    return entries
+
+
 def fetch_popular_and_new_movie4k() -> Dict[str, List[Dict[str, str]]]:
     """
     Fetch popular (trending) and new movies from movie4k.sx JSON API.
@@ -179,58 +330,18 @@ def fetch_popular_and_new_movie4k() -> Dict[str, List[Dict[str, str]]]:
       - popular: order_by=Trending
       - new:     order_by=Neu
 
+    Both listings are independent, so they are requested concurrently.
+
     Returns:
         Dictionary with 'popular' and 'new' keys containing lists of movie data
     """
-    result: Dict[str, List[Dict[str, str]]] = {"popular": [], "new": []}
-
-    # Must NOT include 'br' — requests cannot decode Brotli and the server
-    # returns Brotli when 'br' is advertised, yielding an unreadable body.
-    headers = {
-        "User-Agent": RANDOM_USER_AGENT,
-        "Accept": "application/json, text/plain, */*",
-        "Accept-Encoding": "gzip, deflate",
-        "Referer": f"{MOVIE4K_SX}/browse?c=movie&m=filter&order_by=Neu&lang=&type=movies",
-        "Sec-Fetch-Dest": "empty",
-        "Sec-Fetch-Mode": "cors",
-        "Sec-Fetch-Site": "same-origin",
-    }
-
     queries = [("Trending", "popular"), ("Neu", "new")]
 
-    for order_by, key in queries:
-        api_url = (
-            f"{MOVIE4K_SX}/data/browse/"
-            f"?lang=2&keyword=&year=&networks=&rating=&votes="
-            f"&genre=&country=&cast=&directors="
-            f"&type=movies&order_by={order_by}&page=1&limit=20"
-        )
-        try:
-            resp = requests.get(api_url, timeout=DEFAULT_REQUEST_TIMEOUT, headers=headers)
-            resp.raise_for_status()
-            data = resp.json()
-        except requests.RequestException as err:
-            logging.warning("fetch_popular_and_new_movie4k: request failed for %s: %s", key, err)
-            continue
-        except ValueError as err:
-            logging.warning("fetch_popular_and_new_movie4k: JSON parse failed for %s: %s", key, err)
-            continue
-
-        for m in data.get("movies", []):
-            title = m.get("title", "")
-            if not title:
-                continue
-            movie_id = m.get("_id", "")
-            poster_path = m.get("poster_path", "")
-            cover = f"https://image.tmdb.org/t/p/w92{poster_path}" if poster_path else ""
-            slug = _title_to_slug(title)
-            result[key].append({
-                "name": title,
-                "cover": cover,
-                "url": f"{MOVIE4K_SX}/watch/{slug}/{movie_id}",
-            })
-
-    return result
+    futures = {
+        key: _IO_POOL.submit(_fetch_browse_list, order_by, key)
+        for order_by, key in queries
+    }
+    return {key: future.result() for key, future in futures.items()}
 
 
 def fetch_movie4k_search_results(keyword: str) -> List[Dict]:
@@ -267,6 +378,40 @@ class Movie:
         movie = Movie(movie_id="6195193258607cdfb9fa2e98")
     """
 
+    # Fixed attribute layout: one Movie is created per search result, so
+    # skipping the per-instance __dict__ noticeably cuts memory in batches.
+    __slots__ = (
+        "site",
+        "site_config",
+        "base_url",
+        "movie_id",
+        "slug",
+        "_api_data_cache",
+        "_lang_list_cache",
+        "_title",
+        "_year",
+        "_streams",
+        "_overview",
+        "_runtime",
+        "_rating",
+        "_genres",
+        "_providers_cache",
+        "_prefetch_lock",
+        "_selected_provider",
+        "_selected_language",
+        "embeded_link",
+        "direct_link",
+        "redirect_link",
+        "link",
+        "season",
+        "episode",
+        "season_episode_count",
+        "movie_episode_count",
+    )
+
+    # {provider_lower: (extractor function or None, accepts referer)}
+    _EXTRACTORS: Dict[str, tuple] = {}
+
     def __init__(
         self,
         url: Optional[str] = None,
@@ -299,6 +444,8 @@ class Movie:
         self._runtime: Optional[str] = None
         self._rating: Optional[str] = None
         self._genres: Optional[str] = None
+        self._providers_cache: Optional[Dict[str, List[str]]] = None
+        self._prefetch_lock = threading.Lock()
         arguments = get_arguments()
 
         self._selected_provider = _selected_provider or getattr(
@@ -310,6 +457,9 @@ class Movie:
 
         self.embeded_link: Optional[str] = None
         self.direct_link: Optional[str] = None
+        # Not used by movie4k; kept for parity with Episode, whose link
+        # fields the download manager resets on every provider attempt.
+        self.redirect_link: Optional[str] = None
 
         self.link = f"{self.base_url}/watch/{self.slug}/{self.movie_id}"
 
@@ -339,16 +489,13 @@ class Movie:
             return self._api_data_cache
 
         api_url = f"{self.base_url}/data/watch/?_id={self.movie_id}"
-        response = requests.get(
+        response = _SESSION.get(
             api_url,
             timeout=DEFAULT_REQUEST_TIMEOUT,
-            headers={
-                "User-Agent": RANDOM_USER_AGENT,
-                "Accept": "application/json",
-            },
+            headers=_JSON_HEADERS,
         )
         response.raise_for_status()
-        self._api_data_cache = response.json()
+        self._api_data_cache = _json_loads(response.content)
         return self._api_data_cache or {}
 
     def _fetch_lang_list(self) -> List[Dict]:
@@ -358,60 +505,81 @@ class Movie:
 
         try:
             api_url = f"{self.base_url}/data/langList/?_id={self.movie_id}"
-            response = requests.get(
+            response = _SESSION.get(
                 api_url,
                 timeout=DEFAULT_REQUEST_TIMEOUT,
-                headers={
-                    "User-Agent": RANDOM_USER_AGENT,
-                    "Accept": "application/json",
-                },
+                headers=_JSON_HEADERS,
             )
             response.raise_for_status()
-            self._lang_list_cache = response.json()
+            self._lang_list_cache = _json_loads(response.content)
             return self._lang_list_cache or []
-        except requests.RequestException as err:
+        except (requests.RequestException, ValueError) as err:
             logging.error("Failed to fetch movie4k.sx language list: %s", err)
             return []
 
+    def _prefetch(self) -> Dict[str, Any]:
+        """Fetch movie data and the language list concurrently on first access.
+
+        Most flows need both (title/streams and available languages), so the
+        language list request is overlapped with the movie data request
+        instead of costing a second sequential round trip. Returns the movie
+        data like _fetch_api_data().
+        """
+        if self._api_data_cache is not None:
+            return self._api_data_cache
+
+        with self._prefetch_lock:
+            if self._api_data_cache is not None:
+                return self._api_data_cache
+
+            lang_future = None
+            if self._lang_list_cache is None:
+                lang_future = _IO_POOL.submit(self._fetch_lang_list)
+            try:
+                return self._fetch_api_data()
+            finally:
+                if lang_future is not None:
+                    lang_future.result()
+
     @property
     def title(self) -> str:
         if self._title is None:
-            data = self._fetch_api_data()
+            data = self._prefetch()
             self._title = data.get("title", f"Unknown ({self.slug})")
         return self._title
 
     @property
     def year(self) -> int:
         if self._year is None:
-            data = self._fetch_api_data()
+            data = self._prefetch()
             self._year = data.get("year", 0)
         return self._year or 0
 
     @property
     def overview(self) -> str:
         if self._overview is None:
-            data = self._fetch_api_data()
+            data = self._prefetch()
             self._overview = data.get("storyline") or data.get("overview", "")
         return self._overview or ""
 
     @property
     def runtime(self) -> str:
         if self._runtime is None:
-            data = self._fetch_api_data()
+            data = self._prefetch()
             self._runtime = data.get("runtime", "")
         return self._runtime or ""
 
     @property
     def rating(self) -> str:
         if self._rating is None:
-            data = self._fetch_api_data()
+            data = self._prefetch()
             self._rating = data.get("rating", "")
         return self._rating or ""
 
     @property
     def genres(self) -> str:
         if self._genres is None:
-            data = self._fetch_api_data()
+            data = self._prefetch()
             raw = data.get("genres", "")
             # API sometimes returns a list mixing genres and cast names
             if isinstance(raw, list):
@@ -423,7 +591,7 @@ class Movie:
     @property
     def streams(self) -> List[Dict]:
         if self._streams is None:
-            data = self._fetch_api_data()
+            data = self._prefetch()
             self._streams = data.get("streams", [])
         return self._streams or []
 
@@ -442,16 +610,19 @@ class Movie:
     @property
     def providers(self) -> Dict[str, List[str]]:
         """Get available providers mapped to their stream URLs."""
+        # Streams never change once fetched, so build the mapping only once
+        if self._providers_cache is not None:
+            return self._providers_cache
+
         provider_streams: Dict[str, List[str]] = {}
         for stream in self.streams:
             stream_url = stream.get("stream", "")
             if not stream_url:
                 continue
             provider = _extract_provider_from_url(stream_url)
-            if provider and provider in SUPPORTED_PROVIDERS:
-                if provider not in provider_streams:
-                    provider_streams[provider] = []
-                provider_streams[provider].append(stream_url)
+            if provider and provider in _SUPPORTED_PROVIDERS_SET:
+                provider_streams.setdefault(provider, []).append(stream_url)
+        self._providers_cache = provider_streams
         return provider_streams
 
     @property
@@ -488,38 +659,46 @@ class Movie:
         return None
 
     def _resolve_stream_url_for_movie(self, stream_url: str, referer: Optional[str] = None) -> str:
-        """Resolve movie4k stream redirects (HEAD/GET) and return final URL.
+        """Resolve movie4k stream redirects and return the final URL.
 
-        This helper is scoped to movie4k and attempts to follow server redirects
-        (via HEAD first, falling back to GET) up to a small limit. It also handles
-        protocol-relative Location headers ("//..."). On network errors it
-        returns the original stream_url as a safe fallback.
+        Issues a single streamed GET and lets requests follow the redirect
+        chain (including relative and protocol-relative Location headers);
+        the body is never downloaded. Many provider CDNs reject HEAD, so no
+        HEAD preflight is attempted. On network errors it returns the
+        original stream_url as a safe fallback.
         """
-        headers = {"User-Agent": RANDOM_USER_AGENT}
-        if referer:
-            headers["Referer"] = referer
-        url = stream_url
-        for _ in range(5):
-            try:
-                resp = requests.head(url, headers=headers, timeout=DEFAULT_REQUEST_TIMEOUT, allow_redirects=False)
-                # Follow HTTP redirects manually if Location header provided
-                if resp.status_code in (301, 302, 303, 307, 308) and "Location" in resp.headers:
-                    location = resp.headers["Location"]
-                    if location.startswith("//"):
-                        location = "https:" + location
-                    url = urljoin(url, location)
-                    continue
-
-                # If HEAD didn't reveal a redirect, perform GET with allow_redirects=True
-                resp_get = requests.get(url, headers=headers, timeout=DEFAULT_REQUEST_TIMEOUT, allow_redirects=True)
-                final = getattr(resp_get, "url", None)
-                if final and final != url:
-                    return final
-                return url
-            except requests.RequestException:
-                # On request failure return the original URL to avoid failing the whole flow
-                return stream_url
-        return url
+        headers = {"Referer": referer} if referer else None
+        try:
+            resp = _SESSION.get(
+                stream_url,
+                headers=headers,
+                timeout=DEFAULT_REQUEST_TIMEOUT,
+                allow_redirects=True,
+                stream=True,
+            )
+            resp.close()
+        except requests.RequestException:
+            # On request failure return the original URL to avoid failing the whole flow
+            return stream_url
+        return resp.url or stream_url
+
+    @classmethod
+    def _get_extractor(cls, provider: str) -> tuple:
+        """Return (extractor function, accepts referer) for a provider.
+
+        The extractors package and signature inspection are resolved once
+        per provider and cached on the class.
+        """
+        key = provider.lower()
+        cached = cls._EXTRACTORS.get(key)
+        if cached is None:
+            module = importlib.import_module(".extractors", "aniworld")
+            func = getattr(module, f"get_direct_link_from_{key}", None)
+            accepts_referer = (
+                func is not None and "referer" in inspect.signature(func).parameters
+            )
+            cached = cls._EXTRACTORS[key] = (func, accepts_referer)
+        return cached
 
     def get_direct_link(self) -> Optional[str]:
         """
@@ -532,17 +711,19 @@ class Movie:
         available = self.providers
 
         # Build ordered list: selected provider first, then remaining available
-        provider_order = []
-        if self._selected_provider and self._selected_provider in available:
-            provider_order.append(self._selected_provider)
-        for prov in SUPPORTED_PROVIDERS:
-            if prov in available and prov not in provider_order:
-                provider_order.append(prov)
+        provider_order = [prov for prov in SUPPORTED_PROVIDERS if prov in available]
+        if self._selected_provider in provider_order:
+            provider_order.remove(self._selected_provider)
+            provider_order.insert(0, self._selected_provider)
 
         if not provider_order:
             logging.error("No supported providers available for '%s'", self.title)
             return None
 
+        # Parsed once per process by the parser module; resolve it once here
+        # rather than on every provider retry below.
+        arguments = get_arguments()
+
         for provider in provider_order:
             try:
                 urls = available.get(provider, [])
@@ -559,29 +740,24 @@ class Movie:
                     )
                     if resolved and resolved != self.embeded_link:
                         resolved_provider = _extract_provider_from_url(resolved)
-                        if resolved_provider and resolved_provider in SUPPORTED_PROVIDERS:
+                        if resolved_provider and resolved_provider in _SUPPORTED_PROVIDERS_SET:
                             provider = resolved_provider
                             self._selected_provider = provider
                             self.embeded_link = resolved
                 except Exception:
                     pass
 
-                module = importlib.import_module(".extractors", "aniworld")
-                func_name = f"get_direct_link_from_{provider.lower()}"
-
-                if not hasattr(module, func_name):
+                func, accepts_referer = Movie._get_extractor(provider)
+                if func is None:
                     logging.warning("No extractor for '%s', skipping", provider)
                     continue
 
-                func = getattr(module, func_name)
                 kwargs = {f"embeded_{provider.lower()}_link": self.embeded_link}
 
                 # Only pass referer to providers that accept it
-                sig = inspect.signature(func)
-                if "referer" in sig.parameters:
+                if accepts_referer:
                     kwargs["referer"] = self.link
 
-                arguments = get_arguments()
                 if provider == "Luluvdo":
                     kwargs["arguments"] = arguments
 
@@ -633,6 +809,19 @@ class MovieAnime:
         execute(anime_list=[anime])
     """
 
+    __slots__ = (
+        "movie",
+        "site",
+        "slug",
+        "episode_list",
+        "action",
+        "provider",
+        "language",
+        "aniskip",
+        "output_directory",
+        "_title_cache",
+    )
+
     def __init__(self, movie: Movie) -> None:
         self.movie = movie
         self.site = movie.site
@@ -671,6 +860,40 @@ class MovieAnime:
         return f"MovieAnime(title='{self.title}', provider='{self.provider}')"
 
 
+def resolve_direct_links(movies: List[Movie], max_concurrency: int = 8) -> List[Optional[str]]:
+    """
+    Resolve direct links for several movies concurrently.
+
+    Each movie's get_direct_link() is dominated by independent network
+    round trips (API data, redirect resolution, extractor requests), so
+    running them side by side scales with min(len(movies), max_concurrency).
+    Extractor functions are called from worker threads and must not rely on
+    shared mutable state.
+
+    Args:
+        movies: Movies to resolve
+        max_concurrency: Maximum number of movies resolved at the same time
+
+    Returns:
+        Direct links in the same order as movies; None where every
+        provider failed
+    """
+    def _resolve(movie: Movie) -> Optional[str]:
+        try:
+            return movie.get_direct_link()
+        except ValueError as err:
+            logging.warning("Could not resolve direct link for %s: %s", movie.link, err)
+            return None
+
+    if not movies:
+        return []
+
+    # A dedicated pool: get_direct_link() itself schedules work on _IO_POOL,
+    # so running it inside that pool could starve it.
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(movies))) as pool:
+        return list(pool.map(_resolve, movies))
+
+
 def is_movie4k_url(url: str) -> bool:
     """Check if a URL is a movie4k.sx URL."""
-    return "movie4k" in url
+    return bool(_MOVIE4K_HOST_RE.match(url))
@@ -7,24 +7,209 @@ a JSON API.
 """
 import re
 import logging
-from typing import List, Dict
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, List, Dict, Optional, Set, Tuple
 from urllib.parse import quote
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..config import DEFAULT_REQUEST_TIMEOUT, S_TO, RANDOM_USER_AGENT
 
+__all__ = [
+    "fetch_sto_search_results",
+    "fetch_popular_and_new_sto",
+    "get_season_info",
+    "get_season_episode_count",
+    "get_episode_titles",
+    "get_movie_episode_count",
+    "clear_sto_cache",
+    "clear_sto_series_cache",
+]
+
+# urllib3 only decodes Brotli when the brotli package is importable, so "br"
+# is advertised only then; otherwise the server could send an unreadable body.
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+
+def _force_utf8(response: requests.Response, *args, **kwargs) -> requests.Response:
+    response.encoding = "utf-8"
+    return response
+
 
-def _make_request(url: str) -> requests.Response:
-    """Make HTTP request with error handling."""
-    response = requests.get(
-        url,
-        timeout=DEFAULT_REQUEST_TIMEOUT,
-        headers={"User-Agent": RANDOM_USER_AGENT},
+def _create_session() -> requests.Session:
+    """Create the pooled keep-alive session shared by all s.to requests."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
     )
+    session.mount("https://", adapter)
+    session.headers.update(
+        {"User-Agent": RANDOM_USER_AGENT, "Accept-Encoding": _ACCEPT_ENCODING}
+    )
+    # s.to always serves UTF-8; pinning it skips charset sniffing on .text.
+    session.hooks["response"].append(_force_utf8)
+    return session
+
+
+# Series scrapes issue one request per season to the same host; a shared
+# session reuses the keep-alive connection instead of a new TCP+TLS
+# handshake per page.
+_SESSION = _create_session()
+
+# Season pages are independent, side-effect-free fetches to one host, so they
+# are fanned out over a small shared pool (kept below the session's
+# pool_maxsize). The pool lives for the process so a fan-out does not pay
+# thread start-up on every call.
+_SEASON_WORKERS = 8
+_IO_POOL = ThreadPoolExecutor(max_workers=_SEASON_WORKERS, thread_name_prefix="sto-io")
+
+# Compiled once at import; these run per link inside the scrape loops.
+_SERIE_RE = re.compile(r"/serie/[^/]+")
+_SERIE_PATH_RE = re.compile(r"/serie/")
+# Matched against raw page bytes, so season pages can be counted without a tree.
+_EPISODE_RE = re.compile(rb"/staffel-(\d+)/episode-(\d+)")
+
+# Parse with lxml and only materialise the subtrees each scrape reads.
+# Strainers compare the raw class attribute, so multi-class elements are
+# matched with a whitespace-delimited pattern rather than a plain string.
+_SEARCH_STRAINER = SoupStrainer(
+    "div", class_=re.compile(r"(?:^|\s)search-results-list(?:\s|$)")
+)
+_HOME_STRAINER = SoupStrainer(["section", "article"])
+_TITLES_STRAINER = SoupStrainer(
+    ["strong", "span"],
+    class_=re.compile(r"(?:^|\s)episode-title-(?:ger|eng)(?:\s|$)"),
+)
+
+
+# Search, homepage and series pages are idempotent for minutes, and a single
+# session typically hits the same series page several times (season counts,
+# episode titles, ...). Successful page bodies are kept for a short TTL,
+# bounded by entry count and total size.
+_RESPONSE_TTL = 600.0
+_RESPONSE_CACHE_SIZE = 64
+_RESPONSE_CACHE_MAX_BYTES = 8 * 1024 * 1024
+_response_cache: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+_response_cache_bytes = 0
+_response_cache_lock = threading.Lock()
+
+
+def _fetch_content(url: str) -> bytes:
+    """Fetch a page body with error handling, serving repeats from a TTL cache."""
+    global _response_cache_bytes
+    now = time.monotonic()
+    with _response_cache_lock:
+        cached = _response_cache.get(url)
+        if cached and now - cached[0] < _RESPONSE_TTL:
+            _response_cache.move_to_end(url)
+            return cached[1]
+
+    response = _SESSION.get(url, timeout=DEFAULT_REQUEST_TIMEOUT)
     response.raise_for_status()
-    return response
+    logging.debug(
+        "s.to %s: Content-Encoding=%s", url, response.headers.get("Content-Encoding")
+    )
+    content = response.content
+
+    with _response_cache_lock:
+        previous = _response_cache.pop(url, None)
+        if previous is not None:
+            _response_cache_bytes -= len(previous[1])
+        _response_cache[url] = (now, content)
+        _response_cache_bytes += len(content)
+        while _response_cache and (
+            len(_response_cache) > _RESPONSE_CACHE_SIZE
+            or _response_cache_bytes > _RESPONSE_CACHE_MAX_BYTES
+        ):
+            _response_cache_bytes -= len(_response_cache.popitem(last=False)[1][1])
+    return content
+
+
+def _ttl_bucket() -> int:
+    """Index of the current response-cache TTL window, for lru_cache keys."""
+    return int(time.monotonic() // _RESPONSE_TTL)
+
+
+class _HrefCollector:
+    """lxml parser target that records anchor hrefs and builds no tree."""
+
+    def __init__(self) -> None:
+        self.hrefs: List[str] = []
+
+    def start(self, tag: str, attrib) -> None:
+        if tag == "a":
+            href = attrib.get("href")
+            if href:
+                self.hrefs.append(href)
+
+    def close(self) -> List[str]:
+        return self.hrefs
+
+
+def _scan_hrefs(content: bytes) -> List[str]:
+    """Stream-parse a page and return every anchor href in document order."""
+    # Parsers hold per-document state, so each call gets its own.
+    parser = etree.HTMLParser(target=_HrefCollector(), encoding="utf-8")
+    parser.feed(content)
+    return parser.close()
+
+
+@lru_cache(maxsize=64)
+def _hrefs_cached(url: str, _ttl_bucket: int) -> Tuple[str, ...]:
+    return tuple(_scan_hrefs(_fetch_content(url)))
+
+
+def _get_hrefs(url: str) -> Tuple[str, ...]:
+    """Return the anchor hrefs of ``url``, shared for the cache TTL."""
+    return _hrefs_cached(url, _ttl_bucket())
+
+
+def _get_season_numbers(slug: str) -> Set[int]:
+    """Return the season numbers the series page links to, shared for the cache TTL."""
+    # Only this series' season links (/serie/<slug>/staffel-N), not episode
+    # links or other series; season 0 holds movies/specials and is skipped.
+    season_re = re.compile(rf"/serie/{re.escape(slug)}/staffel-(\d+)$")
+    return {
+        season
+        for href in _get_hrefs(f"{S_TO}/serie/{slug}/")
+        if (m := season_re.search(href)) and (season := int(m.group(1))) > 0
+    }
+
+
+def clear_sto_cache() -> None:
+    """Drop all cached s.to responses, page links and season info."""
+    global _response_cache_bytes
+    with _response_cache_lock:
+        _response_cache.clear()
+        _response_cache_bytes = 0
+    _hrefs_cached.cache_clear()
+    _season_info_cached.cache_clear()
+
+
+def clear_sto_series_cache(slug: str) -> None:
+    """Drop the cached pages of one series so its next lookup refetches them."""
+    global _response_cache_bytes
+    prefix = f"{S_TO}/serie/{slug}/"
+    with _response_cache_lock:
+        for url in [url for url in _response_cache if url.startswith(prefix)]:
+            _response_cache_bytes -= len(_response_cache.pop(url)[1])
+    # lru_cache entries can't be dropped one by one
+    _hrefs_cached.cache_clear()
+    _season_info_cached.cache_clear()
 
 
 def fetch_sto_search_results(keyword: str) -> List[Dict]:
@@ -43,17 +228,14 @@ def fetch_sto_search_results(keyword: str) -> List[Dict]:
     """
     search_url = f"{S_TO}/suche?term={quote(keyword)}"
     try:
-        response = requests.get(
-            search_url,
-            timeout=DEFAULT_REQUEST_TIMEOUT,
-            headers={"User-Agent": RANDOM_USER_AGENT},
-        )
-        response.raise_for_status()
+        content = _fetch_content(search_url)
     except requests.RequestException as err:
         logging.error("Failed to fetch s.to search page: %s", err)
         raise ValueError("Could not fetch s.to search results") from err
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = BeautifulSoup(
+        content, "lxml", parse_only=_SEARCH_STRAINER, from_encoding="utf-8"
+    )
     results = []
 
     # s.to search results are in:
@@ -65,205 +247,183 @@ def fetch_sto_search_results(keyword: str) -> List[Dict]:
         logging.warning("fetch_sto_search_results: could not find div.row.g-3 result container")
         return results
 
-    # Only look for /serie/ links inside the result container
-    items = result_container.find_all("a", href=re.compile(r"/serie/[^/]+"))
-
+    # One top-down pass over the container's children. A result column
+    # (div.col / div.col-*) is the card for every link inside it; a link
+    # outside any column falls back to its parent element.
     seen_slugs = set()
-    for item in items:
-        href = item.get("href", "")
-        if not href or "/serie/" not in href:
-            continue
-
-        # Extract slug from href like /serie/fallout
-        slug = href.rstrip("/").split("/serie/")[-1]
-        # Skip if slug contains sub-paths (staffel/episode links)
-        if "/" in slug or not slug:
-            continue
-        if slug in seen_slugs:
-            continue
-        seen_slugs.add(slug)
-
-        # Walk up to the parent column (direct child of div.row.g-3)
-        col = item.find_parent("div", class_=re.compile(r"col"))
-        # Fallback to any parent div if no col found
-        if not col:
-            col = item.parent
-
-        # Extract title from the link or its parent context
-        name = ""
-        if col:
-            h_tag = col.find(["h6", "h3", "h4", "h5", "h2"])
-            if h_tag:
-                name = h_tag.get_text(strip=True)
-        if not name:
-            name = item.get("title", "")
-        if not name:
-            name = item.get_text(strip=True)
-        if not name:
-            name = slug.replace("-", " ").title()
-
-        # Extract cover image from the column or link
-        cover = ""
-        img_context = col if col else item
-        img = img_context.find("img")
-        if img:
-            cover = img.get("data-src") or img.get("src") or ""
-            if cover and cover.startswith("/"):
-                cover = S_TO + cover
-
-        # Extract year if present
-        year = ""
-        year_context = col if col else item
-        year_el = year_context.find("span", class_="year") or year_context.find(class_="productionYear")
-        if year_el:
-            year = year_el.get_text(strip=True)
-
-        # Extract description if present
-        description = ""
-        desc_context = col if col else item
-        desc_el = desc_context.find("p") or desc_context.find(class_="description")
-        if desc_el:
-            description = desc_el.get_text(strip=True)
-
-        results.append({
-            "name": name,
-            "link": slug,
-            "description": description,
-            "cover": cover,
-            "productionYear": year,
-        })
+    for child in result_container.find_all(True, recursive=False):
+        is_col = child.name == "div" and any(
+            cls == "col" or cls.startswith("col-") for cls in child.get("class", ())
+        )
+        links = child.find_all("a", href=_SERIE_RE)
+        if child.name == "a" and _SERIE_RE.search(child.get("href", "")):
+            links.insert(0, child)
+        for item in links:
+            # Extract slug from href like /serie/fallout, skipping sub-paths
+            # (staffel/episode links)
+            slug = item["href"].rstrip("/").split("/serie/")[-1]
+            if not slug or "/" in slug or slug in seen_slugs:
+                continue
+            seen_slugs.add(slug)
+            results.append(_search_result(item, slug, child if is_col else item.parent))
 
     return results
 
 
+def _search_result(item, slug: str, col) -> Dict:
+    """Build one search result from a series link and the card around it."""
+    # Extract title from the card heading or the link itself
+    h_tag = col.find(["h6", "h3", "h4", "h5", "h2"])
+    name = h_tag.get_text(strip=True) if h_tag else ""
+    if not name:
+        name = item.get("title", "")
+    if not name:
+        name = item.get_text(strip=True)
+    if not name:
+        name = slug.replace("-", " ").title()
+
+    # Extract cover image
+    cover = ""
+    img = col.find("img")
+    if img:
+        cover = img.get("data-src") or img.get("src") or ""
+        if cover and cover.startswith("/"):
+            cover = S_TO + cover
+
+    # Extract year and description if present
+    year_el = col.find("span", class_="year") or col.find(class_="productionYear")
+    year = year_el.get_text(strip=True) if year_el else ""
+    desc_el = col.find("p") or col.find(class_="description")
+    description = desc_el.get_text(strip=True) if desc_el else ""
+
+    return {
+        "name": name,
+        "link": slug,
+        "description": description,
+        "cover": cover,
+        "productionYear": year,
+    }
+
+
 # ---------------------------------------------------------------------------
 # Season / Episode counting for s.to
 # ---------------------------------------------------------------------------
 
-def _parse_season_episodes(soup: BeautifulSoup, season: int) -> int:
-    """Parse episode count for a specific season from s.to HTML."""
-    episode_links = soup.find_all("a", href=True)
-    unique_links = set(
-        link["href"]
-        for link in episode_links
-        if f"staffel-{season}/episode-" in link["href"]
-    )
-    return len(unique_links)
+def _parse_season_episodes(content: bytes, season: int) -> int:
+    """Parse episode count for a specific season from raw s.to HTML."""
+    wanted = str(season).encode()
+    return len({ep for s, ep in _EPISODE_RE.findall(content) if s == wanted})
 
 
 def _parse_episode_titles2(soup: BeautifulSoup) -> Dict[int, str]:
-    titles: Dict[int, str] = {}
-    
-    title2 = soup.select("strong.episode-title-ger")
-    title3 = soup.select("span.episode-title-eng")
-    
-    for i, (tag_de, tag_en) in enumerate(zip(title2, title3), start=1):
-        titles[i] = f"{tag_de.get_text(strip=True)}    /    {tag_en.get_text(strip=True)}"
-    
-    return titles
+    # One selector pass for both languages, split by tag name afterwards.
+    german: List[str] = []
+    english: List[str] = []
+    for tag in soup.select("strong.episode-title-ger, span.episode-title-eng"):
+        (german if tag.name == "strong" else english).append(tag.get_text(strip=True))
 
+    return {
+        i: f"{de}    /    {en}"
+        for i, (de, en) in enumerate(zip(german, english), start=1)
+    }
 
-def get_episode_titles(slug: str) -> Dict[int, Dict[int, str]]:
-    """
-    Get episode titles for all seasons of a series on s.to.
-
-    Returns:
-        {season_num: {episode_num: title_string}}
-    """
-    base_url = f"{S_TO}/serie/{slug}/"
-    all_titles: Dict[int, Dict[int, str]] = {}
 
+def _fetch_and_parse_season(base_url: str, season: int, parse: Callable, default):
+    """Fetch one season page and run ``parse(content, season)`` on its bytes."""
     try:
-        response = _make_request(base_url)
-        soup = BeautifulSoup(response.content, "html.parser")
+        return parse(_fetch_content(f"{base_url}staffel-{season}"), season)
+    except Exception as err:
+        logging.warning("Failed to fetch season %d from %s: %s", season, base_url, err)
+        return default
 
-        # 1️⃣ Staffeln gezielt extrahieren
-        season_numbers = {
-            int(m.group(1))
-            for a in soup.select('a[href*="staffel-"]')
-            if (m := re.search(r"staffel-(\d+)", a.get("href", "")))
-            and int(m.group(1)) > 0
-        }
 
-        for season in sorted(season_numbers):
-            season_url = f"{base_url}staffel-{season}"
-            try:
-                season_response = _make_request(season_url)
-                season_soup = BeautifulSoup(
-                    season_response.content, "html.parser"
-                )
+def _fetch_seasons(base_url: str, seasons, parse: Callable, default) -> Dict:
+    """Fetch and parse all season pages concurrently, keyed by season number."""
+    futures = {
+        season: _IO_POOL.submit(_fetch_and_parse_season, base_url, season, parse, default)
+        for season in sorted(seasons)
+    }
+    return {season: future.result() for season, future in futures.items()}
 
-                titles2 = _parse_episode_titles2(season_soup)
 
-                if not titles2:
-                    logging.warning(
-                        "Season %d has no episode titles", season
-                    )
+def _parse_season_page(content: bytes, season: int) -> Dict:
+    """Derive both the episode count and the titles from one season page."""
+    soup = BeautifulSoup(
+        content, "lxml", parse_only=_TITLES_STRAINER, from_encoding="utf-8"
+    )
+    titles = _parse_episode_titles2(soup)
+    if not titles:
+        logging.warning("Season %d has no episode titles", season)
+    return {"count": _parse_season_episodes(content, season), "titles": titles}
 
-                all_titles[season] = titles2
 
-            except Exception as err:
-                logging.warning(
-                    "Failed to get episode titles for season %d: %s",
-                    season, err
-                )
-                all_titles[season] = {}
+class _IncompleteSeasonInfo(Exception):
+    """Raised out of the season-info memo when a season page failed.
 
-        return all_titles
+    lru_cache does not memoise exceptions, so a transient error is retried
+    on the next call instead of hiding the season for the whole TTL.
+    """
 
-    except Exception as err:
-        logging.error(
-            "Failed to get episode titles for %s on s.to: %s",
-            slug, err
-        )
-        return {}
+    def __init__(self, info: Dict[int, Optional[Dict]]) -> None:
+        super().__init__("incomplete season info")
+        self.info = info
 
 
-def get_season_episode_count(slug: str) -> Dict[int, int]:
+@lru_cache(maxsize=64)
+def _season_info_cached(slug: str, _ttl_bucket: int) -> Dict[int, Dict]:
     base_url = f"{S_TO}/serie/{slug}/"
-    response = _make_request(base_url)
-    soup = BeautifulSoup(response.content, "html.parser")
+    info = _fetch_seasons(base_url, _get_season_numbers(slug), _parse_season_page, None)
+    if None in info.values():
+        raise _IncompleteSeasonInfo(info)
+    return info
 
-    # -------- FIND SEASONS --------
-    season_numbers = set()
 
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
-
-        # match /staffel-<number> but NOT /episode
-        m = re.search(r"/staffel-(\d+)$", href)
-        if m:   
-            season_num = int(m.group(1))
-
-            # optional: ignore season 0 (movies/specials)
-            if season_num > 0:
-                season_numbers.add(season_num)
+def get_season_info(slug: str) -> Dict[int, Dict]:
+    """
+    Get episode counts and titles for all seasons of a series on s.to.
 
-    episode_counts: Dict[int, int] = {}
+    The series page and every season page are fetched once and parsed for
+    both pieces of information. Results are memoised per slug for the
+    response-cache TTL.
 
-    # -------- FOR EACH SEASON --------
-    for season in sorted(season_numbers):
-        season_url = f"{base_url}staffel-{season}"
-        try:
-            season_response = _make_request(season_url)
-            season_soup = BeautifulSoup(season_response.content, "html.parser")
+    Seasons whose page could not be fetched are reported with no episodes
+    and are not memoised.
 
-            episode_links = set()
+    Returns:
+        {season_num: {"count": int, "titles": {episode_num: title_string}}}
+    """
+    try:
+        info = _season_info_cached(slug, _ttl_bucket())
+    except _IncompleteSeasonInfo as err:
+        info = err.info
+    # Copies, so callers can't modify the memoised result
+    return {
+        season: {"count": entry["count"], "titles": dict(entry["titles"])}
+        if entry is not None
+        else {"count": 0, "titles": {}}
+        for season, entry in info.items()
+    }
 
-            for a in season_soup.find_all("a", href=True):
-                href = a["href"]
 
-                # match /staffel-X/episode-Y
-                if f"/staffel-{season}/episode-" in href:
-                    episode_links.add(href)
+def get_episode_titles(slug: str) -> Dict[int, Dict[int, str]]:
+    """
+    Get episode titles for all seasons of a series on s.to.
 
-            episode_counts[season] = len(episode_links)
+    Returns:
+        {season_num: {episode_num: title_string}}
+    """
+    try:
+        return {season: info["titles"] for season, info in get_season_info(slug).items()}
+    except Exception as err:
+        logging.error(
+            "Failed to get episode titles for %s on s.to: %s",
+            slug, err
+        )
+        return {}
 
-        except Exception as err:
-            logging.warning("Failed to get episodes for season %d: %s", season, err)
-            episode_counts[season] = 0
 
-    return episode_counts
+def get_season_episode_count(slug: str) -> Dict[int, int]:
+    return {season: info["count"] for season, info in get_season_info(slug).items()}
 
 
 def fetch_popular_and_new_sto() -> Dict[str, List[Dict[str, str]]]:
@@ -276,115 +436,70 @@ def fetch_popular_and_new_sto() -> Dict[str, List[Dict[str, str]]]:
         Dictionary with 'popular' and 'new' keys containing lists of series data
     """
     try:
-        response = _make_request(S_TO)
-
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        result = {"popular": [], "new": []}
+        content = _fetch_content(S_TO)
 
-        # Extract trending/popular series from "Angesagt" section
-        # Structure: section.trending-widget > div.trend-row > swiper > article.trend-card
-        trending_section = soup.find("section", class_="trending-widget")
-        if trending_section:
-            result["popular"] = _extract_trending_series(trending_section)
-
-        # Extract new series from "Neu auf S.to" section
-        # Structure: h4 with "Neu auf S.to" text, followed by div.row.g-3 with show-card links
-        new_heading = soup.find("section", class_="continue-widget")
-        if new_heading:
-            result["new"] = _extract_new_series(new_heading)
-                
+        soup = BeautifulSoup(
+            content, "lxml", parse_only=_HOME_STRAINER, from_encoding="utf-8"
+        )
 
-        return result
+        # "Angesagt": section.trending-widget > ... > article.trend-card
+        # "Neu auf S.to": section.continue-widget > article.continue-card
+        return {
+            "popular": _extract_cards(
+                soup.select("section.trending-widget article.trend-card"), "trend-title"
+            ),
+            "new": _extract_cards(
+                soup.select("section.continue-widget article.continue-card"),
+                "continue-title",
+            ),
+        }
 
     except requests.RequestException as err:
         logging.error("Failed to fetch s.to homepage: %s", err)
         raise ValueError("Could not fetch s.to homepage data") from err
 
 
-def _extract_trending_series(trending_section) -> List[Dict[str, str]]:
-    """
-    Extract series from s.to trending/Angesagt section.
-
-    Cards are article.trend-card with h3.trend-title and picture > img for cover.
-    """
-    series_list = []
-
-    cards = trending_section.find_all("article", class_="trend-card")
-    for card in cards:
-        try:
-            name = None
-            title_tag = card.find("h3", class_="trend-title")
-            if title_tag:
-                name = title_tag.get_text(strip=True)
-            if not name:
-                link = card.find("a", href=re.compile(r"/serie/"))
-                if link:
-                    name = link.get_text(strip=True) or link.get("title", "")
-
-            cover = _extract_picture_url(card)
-
-            # Extract URL from link
-            url = None
-            link = card.find("a", href=True)
-            if link:
-                href = link.get("href", "")
-                if href.startswith("/"):
-                    url = S_TO + href
-                elif href.startswith("http"):
-                    url = href
-
-            if name and cover:
-                entry = {"name": name, "cover": cover}
-                if url:
-                    entry["url"] = url
-                series_list.append(entry)
-        except Exception:
-            continue
-
-    return series_list
-
-
-def _extract_new_series(row_container) -> List[Dict[str, str]]:
+def _card_to_entry(card, title_cls: str) -> Optional[Dict[str, str]]:
     """
-    Extract series from s.to 'Neu auf S.to' section.
+    Turn one s.to homepage card into ``{name, cover[, url]}``.
 
-    Cards are a.show-card with picture > img, title in h6 or img alt.
+    Cards are articles with an h3 title (``title_cls``), a series link and a
+    picture > img cover. Returns None when the name or cover is missing.
     """
+    link = card.find("a", href=True)
+    href = link["href"] if link else ""
+
+    name = None
+    title_tag = card.find("h3", class_=title_cls)
+    if title_tag:
+        name = title_tag.get_text(strip=True)
+    if not name:
+        serie_link = link if "/serie/" in href else card.find("a", href=_SERIE_PATH_RE)
+        if serie_link:
+            name = serie_link.get_text(strip=True) or serie_link.get("title", "")
+
+    cover = _extract_picture_url(card)
+    if not (name and cover):
+        return None
+
+    entry = {"name": name, "cover": cover}
+    if href.startswith("/"):
+        entry["url"] = S_TO + href
+    elif href.startswith("http"):
+        entry["url"] = href
+    return entry
+
+
+def _extract_cards(cards, title_cls: str) -> List[Dict[str, str]]:
+    """Extract series entries from the trending or 'Neu auf S.to' cards."""
     series_list = []
-
-    cards = row_container.find_all("article", class_="continue-card")
     for card in cards:
         try:
-            name = None
-            title_tag = card.find("h3", class_="continue-title")
-            if title_tag:
-                name = title_tag.get_text(strip=True)
-            if not name:
-                link = card.find("a", href=re.compile(r"/serie/"))
-                if link:
-                    name = link.get_text(strip=True) or link.get("title", "")
-
-            cover = _extract_picture_url(card)
-
-            # Extract URL from link
-            url = None
-            link = card.find("a", href=True)
-            if link:
-                href = link.get("href", "")
-                if href.startswith("/"):
-                    url = S_TO + href
-                elif href.startswith("http"):
-                    url = href
-
-            if name and cover:
-                entry = {"name": name, "cover": cover}
-                if url:
-                    entry["url"] = url
-                series_list.append(entry)
+            entry = _card_to_entry(card, title_cls)
         except Exception:
             continue
-
+        if entry:
+            series_list.append(entry)
     return series_list
 
 
@@ -394,27 +509,22 @@ def _extract_picture_url(element) -> str:
 
     Prefers the img src/data-src, falls back to source srcset.
     """
-    # Try img tag first
+    # Try the first img tag first
     img = element.find("img")
     if img:
         url = img.get("src") or img.get("data-src") or ""
         if url and not url.startswith("data:"):
-            if url.startswith("/"):
-                return S_TO + url
-            return url
+            return S_TO + url if url.startswith("/") else url
 
-    # Try source tags in picture element
+    # Then the source tags of the first picture element, in document order
     picture = element.find("picture")
     if picture:
         for source in picture.find_all("source"):
             srcset = source.get("srcset") or source.get("data-srcset") or ""
-            if srcset:
-                # Take the first URL from srcset
-                first_url = srcset.split(",")[0].strip().split(" ")[0]
-                if first_url and not first_url.startswith("data:"):
-                    if first_url.startswith("/"):
-                        return S_TO + first_url
-                    return first_url
+            # Take the first URL from srcset
+            url = srcset.split(",")[0].strip().split(" ")[0]
+            if url and not url.startswith("data:"):
+                return S_TO + url if url.startswith("/") else url
 
     return ""
 
@@ -431,23 +541,21 @@ def get_movie_episode_count(slug: str) -> int:
     """
     try:
         movie_page_url = f"{S_TO}/serie/{slug}/filme"
-        response = _make_request(movie_page_url)
-        soup = BeautifulSoup(response.content, "html.parser")
-
-        movie_index = 1
-        while True:
-            expected_subpath = f"{slug}/filme/film-{movie_index}"
-            matching_links = [
-                link["href"]
-                for link in soup.find_all("a", href=True)
-                if expected_subpath in link["href"]
-            ]
-            if matching_links:
-                movie_index += 1
-            else:
-                break
-
-        return movie_index - 1
+
+        # Single pass over the links, collecting this series' film-N indices;
+        # links to other series (sidebar, recommendations) are ignored.
+        film_re = re.compile(rf"/{re.escape(slug)}/filme/film-(\d+)\b")
+        indices = {
+            int(m.group(1))
+            for href in _get_hrefs(movie_page_url)
+            if (m := film_re.search(href))
+        }
+
+        # Movies are numbered film-1..K; count the contiguous run from 1
+        count = 0
+        while count + 1 in indices:
+            count += 1
+        return count
 
     except Exception as err:
         logging.error("Failed to get movie count for %s on s.to: %s", slug, err)
@@ -2,27 +2,364 @@
 Flask web application for AnyLoader
 """
 
+import heapq
+import json
 import logging
 import os
+import re
+import struct
+import sys
 import time
 import threading
 import webbrowser
 import subprocess
 import mimetypes
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from functools import wraps
+from urllib.parse import parse_qs, quote, urlparse
+from uuid import UUID
+from functools import lru_cache, wraps
+from itertools import chain, islice
 from flask import Flask, render_template, jsonify, request, session, redirect, url_for, Response, send_file
+from flask.json.provider import DefaultJSONProvider
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import pychromecast
+except ImportError:
+    pychromecast = None
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 from .. import config
+from ..common import (
+    clear_series_cache,
+    get_episode_titles,
+    get_movie_episode_count,
+    get_season_episode_count,
+)
+from ..entry import _group_episodes_by_series
+from ..models import Episode
+from ..search import fetch_anime_list, fetch_sto_search_results
+from ..sites.huhu import HuhuMovie, fetch_huhu_search_results
+from ..sites.movie4k import Movie as Movie4kMovie, fetch_movie4k_search_results
 from .database import UserDatabase
 from .download_manager import get_download_manager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _prefs_loads = orjson.loads
+
+    def _prefs_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _response_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS)
+else:
+    _prefs_loads = json.loads
+
+    def _prefs_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+    def _response_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+
+class _OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that encodes with orjson; installed when it is available."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        # datetimes and dataclasses go through Flask's default() so the
+        # output matches the stdlib provider
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+def _copy_series_episodes(episodes_by_season, movies, slug, description):
+    """Copy a scraped series so cached episode dicts are never mutated."""
+    return (
+        {season: [dict(ep) for ep in eps] for season, eps in episodes_by_season.items()},
+        [dict(movie) for movie in movies],
+        slug,
+        description,
+    )
+
+
+# Fallbacks for search results that don't say which site they came from
+_DEFAULT_SITE = "aniworld.to"
+_DEFAULT_BASE_URL = config.ANIWORLD_TO
+_DEFAULT_STREAM_PATH = "anime/stream"
+
+
+# The same result URLs come back for repeated searches; urlparse is pure
+_parse_url = lru_cache(maxsize=4096)(urlparse)
+
+
+def _result_title(name, year) -> str:
+    """Append the production year to a search result name unless it's already there."""
+    if year and year != "Unknown Year" and str(year) not in name:
+        return f"{name} {year}"
+    return name
+
+
+def _result_slug(link: str, full_url: str, site: str) -> str:
+    """Return the slug the UI uses to identify a search result."""
+    # Movies use the slug part, not the movie id
+    if site == "movie4k.sx" and full_url and "/watch/" in full_url:
+        try:
+            parts = full_url.rstrip("/").split("/")
+            # expected: ... /watch/{slug}/{id}
+            return parts[-2] if len(parts) >= 2 else link
+        except Exception:
+            return link
+    if site == "huhu.to":
+        # URL is https://huhu.to/web-vod/item?id=movie.911430
+        # Use the movie ID (with dots replaced) as slug
+        try:
+            movie_id = parse_qs(_parse_url(full_url).query).get("id", ["unknown"])[0]
+            return movie_id.replace(".", "_")
+        except Exception:
+            return link.split("=")[-1] if "=" in link else link
+    return link if not link.startswith("http") else link.split("/")[-1]
+
+
+def _build_result(anime: dict) -> dict:
+    """Turn a raw site search hit into the result dict returned by /api/search."""
+    g = anime.get
+    link = g("link", "")
+    site = g("site", _DEFAULT_SITE)
+
+    if link and not link.startswith("http"):
+        full_url = f"{g('base_url', _DEFAULT_BASE_URL)}/{g('stream_path', _DEFAULT_STREAM_PATH)}/{link}"
+    else:
+        full_url = link
+
+    name = g("name", "Unknown Name")
+    year = g("productionYear", "Unknown Year")
+
+    return {
+        "title": _result_title(name, year),
+        "url": full_url,
+        "description": g("description", ""),
+        "slug": _result_slug(link, full_url, site),
+        "name": name,
+        "year": year,
+        "site": site,
+        "cover": g("cover", ""),
+        # Propagate type information so the UI can render movies differently
+        "type": g("type", "series"),
+        "is_movie": bool(g("is_movie", False)),
+    }
+
+
+# Episode URLs per slice when grouping a bulk download submission
+_GROUP_CHUNK_SIZE = 8
+
+
+def _count_grouped_episodes(links) -> int:
+    """Return how many episodes _group_episodes_by_series builds from ``links``."""
+    return sum(len(anime.episode_list) for anime in _group_episodes_by_series(links))
+
+
+def _fetch_series_description(series_page_url: str) -> str:
+    """Fetch a series page and return its description, or "" if it has none.
+
+    Raises requests.RequestException when the page can't be fetched.
+    """
+    resp = requests.get(
+        series_page_url,
+        timeout=config.DEFAULT_REQUEST_TIMEOUT,
+        headers={"User-Agent": config.RANDOM_USER_AGENT},
+    )
+    resp.raise_for_status()
+    soup = BeautifulSoup(resp.content, "html.parser")
+    desc_el = soup.find("p", class_="seri_des")
+    if not desc_el:
+        desc_el = soup.find(class_="seri_des") or soup.find(class_="description-text")
+    if desc_el:
+        return desc_el.get("data-full-description", "") or desc_el.get_text(strip=True)
+    return ""
+
+
+def _json_body() -> dict:
+    """Return the request's JSON object body, or {} when it is missing or not an object."""
+    # Decoding goes through app.json, i.e. orjson when it is installed
+    data = request.get_json(silent=True)
+    return data if isinstance(data, dict) else {}
+
+
+def _json_response(data) -> Response:
+    """Encode a large payload straight into a JSON response."""
+    return Response(_response_dumps(data), mimetype="application/json")
+
+
+def _iter_json_object(obj: dict, chunked_key: str):
+    """Yield ``obj`` as JSON bytes, encoding the dict under ``chunked_key`` one entry at a time."""
+    yield b"{"
+    for i, (key, value) in enumerate(obj.items()):
+        yield (b"," if i else b"") + _response_dumps(key) + b":"
+        if key != chunked_key:
+            yield _response_dumps(value)
+            continue
+        yield b"{"
+        for j, (sub_key, sub_value) in enumerate(value.items()):
+            yield (
+                (b"," if j else b"")
+                + _response_dumps(str(sub_key))
+                + b":"
+                + _response_dumps(sub_value)
+            )
+        yield b"}"
+    yield b"}"
+
+
+# FIEMAP is only available on Linux (e.g. ext4)
+_FIEMAP_SUPPORTED = fcntl is not None and sys.platform.startswith("linux")
+_FS_IOC_FIEMAP = 0xC020660B
+# struct fiemap covering the whole file with room for a single extent
+_FIEMAP_REQUEST = struct.pack("=QQIIII", 0, 0xFFFFFFFFFFFFFFFF, 0, 0, 1, 0) + bytes(56)
+
+
+def _dir_fiemap_offset(path: str) -> int:
+    """Return the physical offset of a directory's first extent, or 0 if unknown."""
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return 0
+    try:
+        buf = bytearray(_FIEMAP_REQUEST)
+        fcntl.ioctl(fd, _FS_IOC_FIEMAP, buf)
+        # fm_mapped_extents, then fe_physical of the first extent
+        if not struct.unpack_from("=I", buf, 20)[0]:
+            return 0
+        return struct.unpack_from("=Q", buf, 40)[0]
+    except OSError:
+        return 0
+    finally:
+        os.close(fd)
+
+
 # In-memory set of folder paths currently being fetched for cover images.
 # Prevents duplicate concurrent downloads; resets on server restart so
 # previous failures are retried automatically.
 _cover_fetch_in_progress: set = set()
 
+# Video file extensions recognised in the download directory. The tuple form
+# lets str.endswith test a file name against all of them in one call.
+_VIDEO_EXT = frozenset({'.mp4', '.mkv', '.avi', '.webm', '.mov', '.m4v', '.flv', '.wmv'})
+_VIDEO_EXT_TUPLE = tuple(_VIDEO_EXT)
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
+def _format_size(size_bytes: int) -> str:
+    """Format a byte count in human readable form (1024-based units)."""
+    # bit_length picks the unit directly instead of dividing in a loop
+    idx = min(max(0, (int(size_bytes).bit_length() - 1) // 10), len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * idx)):.1f} {_SIZE_UNITS[idx]}"
+
+
+@lru_cache(maxsize=1)
+def _load_tkinter():
+    """Import tkinter once; returns (tkinter, filedialog) or None if unavailable."""
+    try:
+        import tkinter
+        from tkinter import filedialog
+    except ImportError:
+        return None
+    return tkinter, filedialog
+
+
+# Chromecast connection cache limits: at most this many live connections,
+# and idle ones are closed by a reaper thread that wakes every interval
+_CAST_CACHE_MAX = 8
+_CAST_IDLE_TTL = 300
+_CAST_REAPER_INTERVAL = 60
+
+# Pre-encoded bodies for the login/logout JSON responses
+_INVALID_CREDENTIALS_BODY = b'{"success":false,"error":"Invalid credentials"}'
+
+
+@lru_cache(maxsize=8)
+def _redirect_body(target: str) -> bytes:
+    """Encode ``{"success": true, "redirect": target}`` once per target URL."""
+    return json.dumps({"success": True, "redirect": target}, separators=(",", ":")).encode()
+
+
+# How long a validated session token is trusted before the database is asked again
+_SESSION_CACHE_TTL = 30.0
+
+# Most results /api/search returns across all sites
+_SEARCH_RESULT_CAP = 50
+
+# aniworld.to search endpoint; append the quoted keyword
+_ANIWORLD_SEARCH_URL = f"{config.ANIWORLD_TO}/ajax/seriesSearch?keyword="
+
+# Search results are reused for identical (query, sites) within this window
+_SEARCH_CACHE_TTL = 300
+_SEARCH_CACHE_MAX = 512
+
+# Scraped episode lists kept per series; the TTL is config.EPISODES_CACHE_TTL
+_EPISODES_CACHE_MAX = 256
+
+# Days a previous popular/new list may still be served while it refreshes
+_POPULAR_STALE_DAYS = 7
+
+# Direct URL input: supported host (optionally behind a subdomain), path and query
+_DIRECT_URL_RE = re.compile(
+    r"^https?://(?:[^/?#@]+\.)?(?P<host>aniworld\.to|s\.to|huhu\.to|movie4k\.[a-z]+)"
+    r"(?::\d+)?(?=[/?#]|$)(?P<path>/[^?#]*)?(?:\?(?P<query>[^#]*))?",
+    re.IGNORECASE,
+)
+_MOVIE4K_WATCH_RE = re.compile(r"^/+watch/+(?P<slug>[^/]+)/+(?P<id>[^/]+)")
+
+# /health body around the timestamp, which is refreshed at most once a second
+_HEALTH_PREFIX = b'{"status":"healthy","timestamp":"'
+_HEALTH_SUFFIX = b'"}'
+
+# Series page URL -> stream path and slug; the stream path picks the site
+_SERIES_RE = re.compile(r"/(?P<stream_path>anime/stream|serie)/(?P<slug>[^/?#]+)")
+_SERIES_BASE_URLS = {"anime/stream": config.ANIWORLD_TO, "serie": config.S_TO}
+
+# Extra headers for movie4k.sx JSON API calls; the User-Agent is set on the session
+_MOVIE4K_HEADERS = {"Accept": "application/json"}
+
+# TMDB poster size used for direct movie4k.sx results
+_TMDB_POSTER_PREFIX = "https://image.tmdb.org/t/p/w220_and_h330_face"
+
+# Debounce window for preference writes (seconds)
+_PREFS_FLUSH_DELAY = 0.2
+
+# Preferences live in the same directory as the database
+if os.name == "nt":  # Windows
+    _PREFS_DIR = Path(os.getenv("APPDATA", "")) / "aniworld"
+else:  # Linux/Mac
+    _PREFS_DIR = Path.home() / ".local" / "share" / "aniworld"
+_PREFS_FILE = _PREFS_DIR / "preferences.json"
+
 
 class WebApp:
     """Flask web application wrapper for AnyLoader"""
@@ -51,18 +388,72 @@ class WebApp:
             getattr(arguments, "mobile", False) if arguments else False
         )
         self.db = UserDatabase() if self.auth_enabled else None
+        if self.db:
+            self.db.prepare()
+
+        # Validated session tokens {token: (user, expires_at)}; see _lookup_session
+        self._session_cache: dict = {}
+        self._session_cache_lock = threading.Lock()
+
+        # Keep-alive session for upstream lookups made directly by request handlers
+        self._http = self._create_http_session()
+
+        # Shared pool for querying the search sites in parallel
+        self._search_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="search")
+
+        # Recent search results {(query, sites): (timestamp, results)}, oldest first
+        self._search_cache = OrderedDict()
+        self._search_cache_lock = threading.Lock()
+
+        # Scraped series {(base_url, slug): (timestamp, (episodes, movies, slug, description))}
+        self._episodes_cache = OrderedDict()
+        self._episodes_cache_lock = threading.Lock()
+        # Movie-count and description fetches of episode scrapes; separate
+        # from the search pool so searches can't starve them (or vice versa)
+        self._episodes_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="episodes")
 
         # Download manager with configurable concurrent downloads
         max_concurrent = getattr(config, "DEFAULT_MAX_CONCURRENT_DOWNLOADS", 3)
         self.download_manager = get_download_manager(self.db, max_concurrent)
 
         # Chromecast connection cache
-        self._chromecast_cache = {}  # {uuid: {'cast': cast_obj, 'browser': browser, 'last_used': timestamp}}
+        # LRU order: most recently used last
+        self._chromecast_cache = OrderedDict()  # {uuid: {'cast': cast_obj, 'browser': browser, 'last_used': timestamp}}
         self._chromecast_cache_lock = threading.Lock()
+        # In-flight discoveries {uuid: Future}, so concurrent lookups of the
+        # same device share one get_listed_chromecasts call
+        self._cast_discoveries: dict = {}
+        # The idle-connection reaper starts with the first cached connection
+        self._cast_reaper_started = False
 
         # Daily cache for popular/new content {key: {"data": {...}, "date": "YYYY-MM-DD"}}
         self._popular_cache: dict = {}
         self._popular_cache_lock = threading.Lock()
+        # In-flight scrapes {key: Future}, so concurrent misses share one fetch
+        self._popular_fetches: dict = {}
+        # Encoded response per key {key: (entry, bytes)}, rebuilt when the entry changes
+        self._popular_bodies: dict = {}
+        # Background refreshes of stale popular/new entries
+        self._popular_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="popular")
+
+        # Created once here rather than on every preferences access
+        _PREFS_DIR.mkdir(parents=True, exist_ok=True)
+
+        # Parsed preferences.json, reused until the file's (mtime_ns, size) changes
+        self._prefs_cache: dict = {}
+        self._prefs_cache_key = None
+        self._prefs_lock = threading.Lock()
+
+        # Changes not yet on disk; flushed by a short debounce timer so a
+        # burst of saves becomes a single write
+        self._prefs_pending: dict = {}
+        self._prefs_flush_timer = None
+        self._prefs_write_lock = threading.Lock()
+
+        # Native folder picker: one dialog at a time; set once Tk can't open
+        # a window (e.g. no display) so later requests fail fast
+        self._folder_picker_lock = threading.Lock()
+        self._folder_picker_unavailable = False
 
         # Create Flask app
         self.app = self._create_app()
@@ -70,14 +461,27 @@ class WebApp:
         # Apply saved preferences at startup
         self._apply_saved_preferences()
 
+        # Resolved download directory; refreshed when preferences change
+        self.effective_download_dir = self._resolve_download_dir()
+
         # Ensure FFmpeg is available (download if missing)
         self._ensure_ffmpeg()
 
+        # Video counts for /api/files folders {path: (((dir, mtime_ns), ...), count)};
+        # valid while none of the walked directories' mtimes have changed
+        self._video_count_cache: dict = {}
+        self._video_count_lock = threading.Lock()
+        # Counts subfolders in parallel; each walk mostly waits on the disk
+        self._files_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="files")
+
         # Media library stats (populated by _scan_media_library)
         self._media_stats: dict = {}
+        self._media_stats_lock = threading.Lock()
+        self.scan_complete = threading.Event()
 
-        # Scan for manually placed files at startup
-        self._scan_media_library()
+        # Scan for manually placed files in the background so startup isn't
+        # held up by disk I/O on large libraries
+        self._start_media_scan()
 
         # Backfill series metadata for existing download folders (background)
         self._start_metadata_backfill()
@@ -96,6 +500,22 @@ class WebApp:
         self._update_info: dict = {"latest": None, "is_newest": True}
         self._start_version_check()
 
+        # (uptime seconds, formatted) of the last /api/info response
+        self._uptime_cache = (-1, "")
+
+        # (epoch second, encoded body) of the last /health response
+        self._health_body = (0, b"")
+
+        # The parts of /api/info that never change, encoded once
+        self._info_static_bytes = _response_dumps(
+            {
+                "version": config.VERSION,
+                "status": "running",
+                "supported_providers": list(config.SUPPORTED_PROVIDERS),
+                "platform": config.PLATFORM_SYSTEM,
+            }
+        )
+
         # Setup routes
         self._setup_routes()
 
@@ -111,11 +531,58 @@ class WebApp:
         )
 
         # Configure Flask
-        app.config["SECRET_KEY"] = os.urandom(24)
+        app.config["SECRET_KEY"] = self._load_or_create_secret_key()
         app.config["JSON_SORT_KEYS"] = False
+        if orjson is not None:
+            app.json = _OrjsonProvider(app)
+
+        # Only stat templates for changes while debugging; keep compiled
+        # templates resident otherwise
+        app.config["TEMPLATES_AUTO_RELOAD"] = bool(self.debug)
+        app.jinja_env.auto_reload = bool(self.debug)
+        app.jinja_env.cache_size = 400
 
         return app
 
+    @staticmethod
+    def _create_http_session() -> requests.Session:
+        """Create the pooled session used for upstream API calls."""
+        http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.2),
+        )
+        http.mount("https://", adapter)
+        http.headers["User-Agent"] = config.RANDOM_USER_AGENT
+        return http
+
+    def _load_or_create_secret_key(self) -> bytes:
+        """
+        Return the Flask secret key, persisted next to the preferences.
+
+        A key that survives restarts keeps existing Flask sessions valid
+        instead of forcing every client to re-authenticate.
+        """
+        key_path = self._get_preferences_file().parent / "secret.key"
+        try:
+            key = key_path.read_bytes()
+            if len(key) >= 32:
+                return key
+        except OSError:
+            pass
+
+        key = os.urandom(32)
+        try:
+            fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                os.write(fd, key)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            logging.warning(f"Could not persist secret key, sessions will reset on restart: {e}")
+        return key
+
     def _apply_saved_preferences(self):
         """Apply saved preferences at startup."""
         try:
@@ -144,6 +611,12 @@ class WebApp:
         except Exception as e:
             logging.warning(f"Could not apply saved preferences: {e}")
 
+    def _resolve_download_dir(self) -> Path:
+        """Return the download directory from the arguments or the default."""
+        if self.arguments and getattr(self.arguments, "output_dir", None) is not None:
+            return Path(self.arguments.output_dir)
+        return Path(config.DEFAULT_DOWNLOAD_PATH)
+
     def _ensure_ffmpeg(self):
         """Ensure FFmpeg is available, downloading if necessary."""
         from ..ffmpeg_downloader import ensure_ffmpeg
@@ -156,18 +629,10 @@ class WebApp:
 
     def _get_preferences_file(self) -> Path:
         """Get the path to the preferences file."""
-        # Store preferences in the same directory as the database
-        if os.name == "nt":  # Windows
-            prefs_dir = Path(os.getenv("APPDATA", "")) / "aniworld"
-        else:  # Linux/Mac
-            prefs_dir = Path.home() / ".local" / "share" / "aniworld"
-
-        prefs_dir.mkdir(parents=True, exist_ok=True)
-        return prefs_dir / "preferences.json"
+        return _PREFS_FILE
 
     def _load_preferences(self) -> dict:
         """Load preferences from file or return defaults."""
-        import json
 
         defaults = {
             "max_concurrent_downloads": getattr(config, "DEFAULT_MAX_CONCURRENT_DOWNLOADS", 5),
@@ -186,21 +651,39 @@ class WebApp:
         if self.arguments and hasattr(self.arguments, "output_dir") and self.arguments.output_dir:
             defaults["download_directory"] = str(self.arguments.output_dir)
 
-        prefs_file = self._get_preferences_file()
-        if prefs_file.exists():
-            try:
-                with open(prefs_file, "r") as f:
-                    saved_prefs = json.load(f)
-                    # Merge saved preferences with defaults
-                    defaults.update(saved_prefs)
-            except Exception as e:
-                logging.error(f"Error loading preferences: {e}")
+        try:
+            # Merge saved preferences with defaults
+            defaults.update(self._read_saved_preferences())
+        except Exception as e:
+            logging.error(f"Error loading preferences: {e}")
 
         return defaults
 
+    def _read_saved_preferences(self) -> dict:
+        """Return the saved preferences, re-reading the file only when it changed."""
+
+        prefs_file = self._get_preferences_file()
+        try:
+            st = os.stat(prefs_file)
+        except FileNotFoundError:
+            with self._prefs_lock:
+                return self._prefs_cache if self._prefs_pending else {}
+
+        key = (st.st_mtime_ns, st.st_size)
+        with self._prefs_lock:
+            if self._prefs_pending or key == self._prefs_cache_key:
+                return self._prefs_cache
+
+        saved_prefs = _prefs_loads(prefs_file.read_bytes())
+        with self._prefs_lock:
+            # A save that landed while reading wins over the file contents
+            if self._prefs_pending:
+                return self._prefs_cache
+            self._prefs_cache, self._prefs_cache_key = saved_prefs, key
+        return saved_prefs
+
     def _save_preferences(self, data: dict):
         """Save preferences to file."""
-        import json
 
         # Validate inputs
         if "max_concurrent_downloads" in data:
@@ -227,10 +710,14 @@ class WebApp:
         current_prefs = self._load_preferences()
         current_prefs.update(data)
 
-        # Save to file
-        prefs_file = self._get_preferences_file()
-        with open(prefs_file, "w") as f:
-            json.dump(current_prefs, f, indent=2)
+        # Readers see the new values from the cache immediately; the file
+        # is written once the debounce window closes
+        with self._prefs_lock:
+            self._prefs_cache = current_prefs
+            self._prefs_pending.update(data)
+            if self._prefs_flush_timer is None:
+                self._prefs_flush_timer = threading.Timer(_PREFS_FLUSH_DELAY, self._flush_prefs)
+                self._prefs_flush_timer.start()
 
         # Update runtime config if applicable
         if "max_concurrent_downloads" in data:
@@ -244,101 +731,148 @@ class WebApp:
             from ..parser import get_arguments
             arguments = get_arguments()
             arguments.output_dir = data["download_directory"]
+            self.effective_download_dir = Path(data["download_directory"])
             logging.info(f"Updated runtime output_dir to: {data['download_directory']}")
 
         # Log saved preferences (excluding sensitive token)
         safe_log = {k: v for k, v in data.items() if k != "plex_token"}
         logging.info(f"Preferences saved: {safe_log}")
 
+    def _flush_prefs(self):
+        """Write pending preference changes to disk in one atomic write."""
+        with self._prefs_write_lock:
+            with self._prefs_lock:
+                self._prefs_flush_timer = None
+                if not self._prefs_pending:
+                    return
+                self._prefs_pending = {}
+                snapshot = dict(self._prefs_cache)
+
+            # One write to a temp file, fsync, then an atomic rename so a
+            # crash mid-write can never leave truncated preferences
+            try:
+                prefs_file = self._get_preferences_file()
+                payload = _prefs_dumps(snapshot)
+                tmp_file = prefs_file.with_suffix(".json.tmp")
+                fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    os.write(fd, payload)
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+                os.replace(tmp_file, prefs_file)
+                st = os.stat(prefs_file)
+            except OSError as e:
+                logging.error(f"Error writing preferences: {e}")
+                return
+
+            with self._prefs_lock:
+                self._prefs_cache_key = (st.st_mtime_ns, st.st_size)
+
     def _reset_preferences(self):
         """Reset preferences to defaults."""
-        prefs_file = self._get_preferences_file()
-        if prefs_file.exists():
-            prefs_file.unlink()
+        with self._prefs_write_lock:
+            with self._prefs_lock:
+                if self._prefs_flush_timer is not None:
+                    self._prefs_flush_timer.cancel()
+                    self._prefs_flush_timer = None
+                self._prefs_pending = {}
+                self._prefs_cache = {}
+                self._prefs_cache_key = None
+
+            prefs_file = self._get_preferences_file()
+            if prefs_file.exists():
+                prefs_file.unlink()
         logging.info("Preferences reset to defaults")
 
+    def _start_media_scan(self):
+        """Start a background thread that scans the media library."""
+        def _scan():
+            try:
+                self._scan_media_library()
+            finally:
+                self.scan_complete.set()
+
+        threading.Thread(target=_scan, daemon=True, name="media-scan").start()
+
     def _scan_media_library(self):
         """Scan the download directory for manually placed files at startup."""
         try:
-            # Get download directory
-            download_path = str(config.DEFAULT_DOWNLOAD_PATH)
-            if (
-                self.arguments
-                and hasattr(self.arguments, "output_dir")
-                and self.arguments.output_dir is not None
-            ):
-                download_path = str(self.arguments.output_dir)
-
-            download_dir = Path(download_path)
+            download_dir = self.effective_download_dir
+            download_path = str(download_dir)
 
             if not download_dir.exists():
                 logging.info(f"Media library directory does not exist yet: {download_path}")
                 return
 
-            # Scan for video files
-            video_extensions = {'.mp4', '.mkv', '.avi', '.webm', '.mov', '.m4v', '.flv', '.wmv'}
-
             series_count = 0
             season_count = 0
             episode_count = 0
             total_size = 0
 
             # Scan directory structure: series/seasonX/episodes
-            for series_dir in download_dir.iterdir():
-                if series_dir.is_dir():
+            # os.scandir reuses the readdir file type, so is_dir()/is_file()
+            # need no extra stat; only video files are stat'ed for their size.
+            with os.scandir(download_dir) as series_entries:
+                for series_dir in series_entries:
+                    if not series_dir.is_dir():
+                        continue
                     series_count += 1
                     has_seasons = False
+                    # Non-season subfolders, only walked if no season folder exists
+                    subdirs_to_scan = []
+
+                    with os.scandir(series_dir.path) as items:
+                        for item in items:
+                            if item.is_dir():
+                                # Check if it's a season folder
+                                folder_name = item.name.lower()
+                                if folder_name.startswith('season') or folder_name == 'movies':
+                                    has_seasons = True
+                                    season_count += 1
+
+                                    # Count episodes in this season
+                                    with os.scandir(item.path) as episodes:
+                                        for episode_file in episodes:
+                                            if episode_file.is_file() and episode_file.name.lower().endswith(_VIDEO_EXT_TUPLE):
+                                                episode_count += 1
+                                                total_size += episode_file.stat().st_size
+                                else:
+                                    subdirs_to_scan.append(item.path)
+
+                            elif item.is_file() and item.name.lower().endswith(_VIDEO_EXT_TUPLE):
+                                # Video file directly in series folder (old structure)
+                                episode_count += 1
+                                total_size += item.stat().st_size
 
-                    for item in series_dir.iterdir():
-                        if item.is_dir():
-                            # Check if it's a season folder
-                            folder_name = item.name.lower()
-                            if folder_name.startswith('season') or folder_name == 'movies':
-                                has_seasons = True
-                                season_count += 1
-
-                                # Count episodes in this season
-                                for episode_file in item.iterdir():
-                                    if episode_file.is_file() and episode_file.suffix.lower() in video_extensions:
-                                        episode_count += 1
-                                        total_size += episode_file.stat().st_size
-
-                        elif item.is_file() and item.suffix.lower() in video_extensions:
-                            # Video file directly in series folder (old structure)
-                            episode_count += 1
-                            total_size += item.stat().st_size
-
-                    # If no seasons found, check for videos directly in series folder
+                    # If no seasons found, check for videos in the nested folders
+                    # collected above; the series folder itself is not re-listed
                     if not has_seasons:
-                        for video_file in series_dir.rglob('*'):
-                            if video_file.is_file() and video_file.suffix.lower() in video_extensions:
-                                if video_file.parent == series_dir:
-                                    continue  # Already counted above
-                                episode_count += 1
-                                total_size += video_file.stat().st_size
-
-            # Format total size
-            def format_size(size_bytes):
-                for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-                    if size_bytes < 1024.0:
-                        return f"{size_bytes:.1f} {unit}"
-                    size_bytes /= 1024.0
-                return f"{size_bytes:.1f} PB"
-
-            self._media_stats = {
-                "series": series_count,
-                "seasons": season_count,
-                "episodes": episode_count,
-                "size": format_size(total_size),
-            }
+                        stack = subdirs_to_scan
+                        while stack:
+                            with os.scandir(stack.pop()) as entries:
+                                for entry in entries:
+                                    if entry.is_dir(follow_symlinks=False):
+                                        stack.append(entry.path)
+                                    elif entry.is_file() and entry.name.lower().endswith(_VIDEO_EXT_TUPLE):
+                                        episode_count += 1
+                                        total_size += entry.stat().st_size
+
+            with self._media_stats_lock:
+                self._media_stats = {
+                    "series": series_count,
+                    "seasons": season_count,
+                    "episodes": episode_count,
+                    "size": _format_size(total_size),
+                }
 
             if episode_count > 0:
                 logging.info(
                     f"Media library scan complete: {series_count} series, "
                     f"{season_count} seasons, {episode_count} episodes "
-                    f"({format_size(total_size)})"
+                    f"({_format_size(total_size)})"
                 )
-                print(f" Media Library: {series_count} series, {season_count} seasons, {episode_count} episodes ({format_size(total_size)})")
+                print(f" Media Library: {series_count} series, {season_count} seasons, {episode_count} episodes ({_format_size(total_size)})")
             else:
                 logging.info(f"Media library is empty: {download_path}")
 
@@ -353,23 +887,14 @@ class WebApp:
     def _backfill_series_metadata(self):
         """Scan download folders and create .series_meta.json where missing."""
         try:
-            import json as json_mod
             from ..search import fetch_anime_list
             from urllib.parse import quote
 
-            download_path = str(config.DEFAULT_DOWNLOAD_PATH)
-            if (
-                self.arguments
-                and hasattr(self.arguments, "output_dir")
-                and self.arguments.output_dir is not None
-            ):
-                download_path = str(self.arguments.output_dir)
-
-            download_dir = Path(download_path)
+            download_dir = self.effective_download_dir
             if not download_dir.exists():
                 return
 
-            video_extensions = {'.mp4', '.mkv', '.avi', '.webm', '.mov', '.m4v', '.flv', '.wmv'}
+            video_extensions = _VIDEO_EXT
             folders_to_backfill = []
 
             for item in download_dir.iterdir():
@@ -379,7 +904,7 @@ class WebApp:
                 if meta_file.exists():
                     # Validate existing metadata has required fields
                     try:
-                        meta = json_mod.loads(meta_file.read_text(encoding="utf-8"))
+                        meta = json.loads(meta_file.read_text(encoding="utf-8"))
                         if meta.get("url") and meta.get("title"):
                             continue  # Already has valid metadata
                     except Exception:
@@ -406,7 +931,7 @@ class WebApp:
 
                     # Search on aniworld.to
                     try:
-                        url = f"{config.ANIWORLD_TO}/ajax/seriesSearch?keyword={quote(folder_name)}"
+                        url = _ANIWORLD_SEARCH_URL + quote(folder_name)
                         results = fetch_anime_list(url)
                         for r in results:
                             name = r.get("name", "")
@@ -458,7 +983,7 @@ class WebApp:
                     if best_match:
                         meta_file = folder / ".series_meta.json"
                         meta_file.write_text(
-                            json_mod.dumps(best_match, ensure_ascii=False),
+                            json.dumps(best_match, ensure_ascii=False),
                             encoding="utf-8"
                         )
                         logging.info(
@@ -475,14 +1000,44 @@ class WebApp:
         except Exception as e:
             logging.warning(f"Metadata backfill error: {e}")
 
+    def _lookup_session(self, session_token):
+        """Return the user for a session token, caching valid sessions briefly."""
+        if not session_token:
+            return None
+
+        now = time.monotonic()
+        with self._session_cache_lock:
+            cached = self._session_cache.get(session_token)
+            if cached and cached[1] > now:
+                return cached[0]
+
+        user = self.db.get_user_by_session_fast(session_token)
+        if user:
+            with self._session_cache_lock:
+                if len(self._session_cache) >= 1024:
+                    # Drop expired entries so stale tokens cannot pile up
+                    self._session_cache = {
+                        k: v for k, v in self._session_cache.items() if v[1] > now
+                    }
+                self._session_cache[session_token] = (user, now + _SESSION_CACHE_TTL)
+        return user
+
+    def _invalidate_session_cache(self, session_token=None):
+        """Forget one cached session, or all of them when no token is given."""
+        with self._session_cache_lock:
+            if session_token is None:
+                self._session_cache.clear()
+            else:
+                self._session_cache.pop(session_token, None)
+
     def _require_api_auth(self, f):
         """Decorator to require authentication for API routes."""
+        # auth_enabled is fixed at startup, so skip the wrapper entirely
+        if not self.auth_enabled:
+            return f
 
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            if not self.auth_enabled:
-                return f(*args, **kwargs)
-
             if not self.db:
                 return jsonify({"error": "Authentication database not available"}), 500
 
@@ -490,7 +1045,7 @@ class WebApp:
             if not session_token:
                 return jsonify({"error": "Authentication required"}), 401
 
-            user = self.db.get_user_by_session(session_token)
+            user = self._lookup_session(session_token)
             if not user:
                 return jsonify({"error": "Invalid session"}), 401
 
@@ -500,12 +1055,11 @@ class WebApp:
 
     def _require_auth(self, f):
         """Decorator to require authentication for routes."""
+        if not self.auth_enabled:
+            return f
 
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            if not self.auth_enabled:
-                return f(*args, **kwargs)
-
             if not self.db:
                 return redirect(url_for("login"))
 
@@ -514,7 +1068,7 @@ class WebApp:
             if not session_token:
                 return redirect(url_for("login"))
 
-            user = self.db.get_user_by_session(session_token)
+            user = self._lookup_session(session_token)
             if not user:
                 return redirect(url_for("login"))
 
@@ -526,12 +1080,11 @@ class WebApp:
 
     def _require_admin(self, f):
         """Decorator to require admin privileges for routes."""
+        if not self.auth_enabled:
+            return f
 
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            if not self.auth_enabled:
-                return f(*args, **kwargs)
-
             if not self.db:
                 return jsonify({"error": "Authentication database not available"}), 500
 
@@ -539,7 +1092,7 @@ class WebApp:
             if not session_token:
                 return redirect(url_for("login"))
 
-            user = self.db.get_user_by_session(session_token)
+            user = self._lookup_session(session_token)
             if not user or not user["is_admin"]:
                 return jsonify({"error": "Admin access required"}), 403
 
@@ -559,67 +1112,133 @@ class WebApp:
         Returns:
             cast object if found, None if not found
         """
-        import pychromecast
-        from uuid import UUID
-
+        # The lock only guards the dict; the connection probe and the
+        # multi-second discovery run outside it so other lookups aren't blocked
         with self._chromecast_cache_lock:
             # Check if we have a cached connection
-            if device_uuid in self._chromecast_cache:
-                cached = self._chromecast_cache[device_uuid]
-                cast = cached['cast']
-
-                # Check if the cast is still connected
-                try:
-                    # Update last used time
-                    cached['last_used'] = time.time()
+            cached = self._chromecast_cache.get(device_uuid)
+            if cached:
+                self._chromecast_cache.move_to_end(device_uuid)
+                # Update last used time
+                cached['last_used'] = time.time()
+
+        if cached:
+            cast = cached['cast']
+            # Check if the cast is still connected
+            try:
+                if cast.socket_client and cast.socket_client.is_connected:
+                    return cast
+            except Exception:
+                pass
 
-                    # Try to access the socket to verify connection
-                    if cast.socket_client and cast.socket_client.is_connected:
-                        return cast
-                except Exception:
-                    pass
+            # Connection is stale; drop it unless another thread replaced it
+            with self._chromecast_cache_lock:
+                removed = self._chromecast_cache.get(device_uuid) is cached
+                if removed:
+                    del self._chromecast_cache[device_uuid]
+            if removed:
+                self._close_chromecast_entry(cached)
 
-                # Connection is stale, clean it up
-                self._cleanup_cached_chromecast(device_uuid)
+        # Need to discover the device; join a discovery already in flight
+        with self._chromecast_cache_lock:
+            future = self._cast_discoveries.get(device_uuid)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._cast_discoveries[device_uuid] = future
 
-            # Need to discover the device
+        if not is_owner:
             try:
-                chromecasts, browser = pychromecast.get_listed_chromecasts(
-                    uuids=[UUID(device_uuid)],
-                    timeout=timeout
-                )
+                return future.result(timeout=timeout + 5)
+            except Exception:
+                return None
 
-                if chromecasts:
-                    cast = chromecasts[0]
-                    # Cache the connection
-                    self._chromecast_cache[device_uuid] = {
-                        'cast': cast,
-                        'browser': browser,
-                        'last_used': time.time()
-                    }
-                    return cast
+        cast = None
+        try:
+            cast = self._discover_and_cache_chromecast(device_uuid, timeout)
+        finally:
+            with self._chromecast_cache_lock:
+                self._cast_discoveries.pop(device_uuid, None)
+            future.set_result(cast)
+        return cast
+
+    def _discover_and_cache_chromecast(self, device_uuid, timeout):
+        """Discover a Chromecast by UUID and add it to the connection cache."""
+        try:
+            chromecasts, browser = pychromecast.get_listed_chromecasts(
+                uuids=[UUID(device_uuid)],
+                timeout=timeout
+            )
+        except Exception as e:
+            logging.error(f"Failed to discover Chromecast: {e}")
+            return None
 
-                # No device found, stop the browser
-                if browser:
-                    browser.stop_discovery()
-                return None
+        if not chromecasts:
+            # No device found, stop the browser
+            if browser:
+                browser.stop_discovery()
+            return None
 
-            except Exception as e:
-                logging.error(f"Failed to discover Chromecast: {e}")
-                return None
+        entry = {
+            'cast': chromecasts[0],
+            'browser': browser,
+            'last_used': time.time()
+        }
+        evicted = []
+        start_reaper = False
+        with self._chromecast_cache_lock:
+            existing = self._chromecast_cache.get(device_uuid)
+            if existing is None:
+                # Cache the connection
+                self._chromecast_cache[device_uuid] = entry
+                start_reaper = not self._cast_reaper_started
+                self._cast_reaper_started = True
+                # Evict least recently used connections beyond the cap
+                while len(self._chromecast_cache) > _CAST_CACHE_MAX:
+                    evicted.append(self._chromecast_cache.popitem(last=False)[1])
+            else:
+                self._chromecast_cache.move_to_end(device_uuid)
+                existing['last_used'] = time.time()
 
-    def _cleanup_cached_chromecast(self, device_uuid):
-        """Clean up a cached Chromecast connection."""
-        if device_uuid in self._chromecast_cache:
-            cached = self._chromecast_cache[device_uuid]
-            try:
-                if cached.get('browser'):
-                    cached['browser'].stop_discovery()
-                if cached.get('cast'):
-                    cached['cast'].disconnect()
-            except Exception:
-                pass
-            del self._chromecast_cache[device_uuid]
+        if existing is not None:
+            # Another thread discovered the device meanwhile; keep theirs
+            self._close_chromecast_entry(entry)
+            return existing['cast']
+
+        if start_reaper:
+            self._start_chromecast_reaper()
+        for old in evicted:
+            self._close_chromecast_entry(old)
+        return entry['cast']
+
+    @staticmethod
+    def _close_chromecast_entry(cached):
+        """Stop discovery and disconnect a removed cache entry."""
+        try:
+            if cached.get('browser'):
+                cached['browser'].stop_discovery()
+            if cached.get('cast'):
+                cached['cast'].disconnect()
+        except Exception:
+            pass
+
+    def _start_chromecast_reaper(self):
+        """Start a background thread that closes idle Chromecast connections."""
+        def _reap():
+            while True:
+                time.sleep(_CAST_REAPER_INTERVAL)
+                cutoff = time.time() - _CAST_IDLE_TTL
+                with self._chromecast_cache_lock:
+                    stale = [
+                        self._chromecast_cache.pop(uuid)
+                        for uuid, cached in list(self._chromecast_cache.items())
+                        if cached['last_used'] < cutoff
+                    ]
+                # Disconnect outside the lock so lookups aren't held up
+                for cached in stale:
+                    self._close_chromecast_entry(cached)
+
+        threading.Thread(target=_reap, daemon=True, name="chromecast-reaper").start()
 
     def _discover_chromecast_by_uuid(self, device_uuid, timeout=10):
         """
@@ -639,6 +1258,169 @@ class WebApp:
             return cast, None
         return None, None
 
+    def _direct_movie4k(self, url, host, path, query):
+        """Resolve a movie4k.sx /watch/{slug}/{id} URL via the site's JSON API."""
+        watch = _MOVIE4K_WATCH_RE.match(path)
+        if not watch:
+            return jsonify(
+                {"success": False, "error": "Invalid movie4k.sx URL format"}
+            ), 400
+        slug, movie_id = watch["slug"], watch["id"]
+
+        try:
+            api_url = f"{config.MOVIE4K_SX}/data/watch/?_id={movie_id}"
+            resp = self._http.get(
+                api_url,
+                timeout=config.DEFAULT_REQUEST_TIMEOUT,
+                headers=_MOVIE4K_HEADERS,
+            )
+            resp.raise_for_status()
+            movie_data = resp.json()
+
+            title = movie_data.get("title", slug.replace("-", " ").title())
+            year = movie_data.get("year", "")
+            if year and str(year) not in title:
+                display_title = f"{title} ({year})"
+            else:
+                display_title = title
+
+            poster = movie_data.get("poster_path", "")
+            cover = _TMDB_POSTER_PREFIX + poster if poster else ""
+
+            anime_result = {
+                "title": display_title,
+                "url": url,
+                "slug": slug,
+                "site": "movie4k.sx",
+                "description": movie_data.get("storyline", movie_data.get("overview", "")),
+                "cover": cover,
+            }
+        except Exception as movie_err:
+            logging.warning(f"Failed to fetch movie4k.sx details: {movie_err}")
+            anime_result = {
+                "title": slug.replace("-", " ").title(),
+                "url": url,
+                "slug": slug,
+                "site": "movie4k.sx",
+                "description": "",
+                "cover": "",
+            }
+
+        return jsonify(
+            {
+                "success": True,
+                "result": anime_result,
+                "source": "direct_url",
+            }
+        )
+
+    def _direct_huhu(self, url, host, path, query):
+        """Resolve a huhu.to web-vod item URL."""
+        try:
+            movie_obj = HuhuMovie(url=url)
+            anime_result = {
+                "title": movie_obj.title,
+                "url": url,
+                "slug": movie_obj.slug,
+                "site": "huhu.to",
+                "description": movie_obj.overview or "",
+                "cover": movie_obj.cover or "",
+            }
+        except Exception as huhu_err:
+            logging.warning(f"Failed to fetch huhu.to details: {huhu_err}")
+            # Best-effort fallback from URL query params
+            try:
+                _movie_id = parse_qs(query).get("id", ["unknown"])[0]
+            except Exception:
+                _movie_id = "unknown"
+            anime_result = {
+                "title": _movie_id.replace("movie.", "").replace(".", " ").title(),
+                "url": url,
+                "slug": _movie_id.replace(".", "_"),
+                "site": "huhu.to",
+                "description": "",
+                "cover": "",
+            }
+        return jsonify(
+            {
+                "success": True,
+                "result": anime_result,
+                "source": "direct_url",
+            }
+        )
+
+    def _direct_series(self, url, host, path, query):
+        """Resolve an aniworld.to or s.to series URL through the site search."""
+        # Determine site and stream path for aniworld/s.to
+        if host == "s.to":
+            site = "s.to"
+        else:
+            site = "aniworld.to"
+
+        # Extract slug from URL (last part of path)
+        slug = path.rstrip("/").rpartition("/")[2]
+        if not slug:
+            return jsonify(
+                {"success": False, "error": "Invalid URL format"}
+            ), 400
+
+        # Use search functionality to get the full anime details
+        try:
+            search_query = slug.replace("-", " ")
+
+            if site == "s.to":
+                search_results = fetch_sto_search_results(search_query)
+            else:
+                search_url = _ANIWORLD_SEARCH_URL + search_query
+                search_results = fetch_anime_list(search_url)
+
+            matching_anime = None
+            for anime in search_results:
+                if anime.get("link", "").strip() == slug:
+                    matching_anime = anime
+                    break
+
+            if matching_anime:
+                name = matching_anime.get("name", slug.replace("-", " ").title())
+                year = matching_anime.get("productionYear", "")
+
+                anime_result = {
+                    "title": _result_title(name, year),
+                    "url": url,
+                    "slug": slug,
+                    "site": site,
+                    "description": matching_anime.get("description", ""),
+                    "cover": matching_anime.get("cover", ""),
+                }
+            else:
+                anime_result = {
+                    "title": slug.replace("-", " ").title(),
+                    "url": url,
+                    "slug": slug,
+                    "site": site,
+                    "description": "",
+                    "cover": "",
+                }
+
+        except Exception as search_err:
+            logging.warning(f"Failed to fetch details from search for direct URL: {search_err}")
+            anime_result = {
+                "title": slug.replace("-", " ").title(),
+                "url": url,
+                "slug": slug,
+                "site": site,
+                "description": "",
+                "cover": "",
+            }
+
+        return jsonify(
+            {
+                "success": True,
+                "result": anime_result,
+                "source": "direct_url",
+            }
+        )
+
     def _setup_routes(self):
         """Setup Flask routes."""
 
@@ -662,7 +1444,7 @@ class WebApp:
 
                 # Get current user info for template
                 session_token = request.cookies.get("session_token")
-                user = self.db.get_user_by_session(session_token)
+                user = self._lookup_session(session_token)
                 return render_template(template, user=user, auth_enabled=True, preferences=preferences_data, providers=providers)
             else:
                 return render_template(template, auth_enabled=False, preferences=preferences_data, providers=providers)
@@ -690,7 +1472,9 @@ class WebApp:
                 user = self.db.verify_user(username, password)
                 if user:
                     session_token = self.db.create_session(user["id"])
-                    response = jsonify({"success": True, "redirect": url_for("index")})
+                    response = Response(
+                        _redirect_body(url_for("index")), mimetype="application/json"
+                    )
                     response.set_cookie(
                         "session_token",
                         session_token,
@@ -700,9 +1484,9 @@ class WebApp:
                     )
                     return response
                 else:
-                    return jsonify(
-                        {"success": False, "error": "Invalid credentials"}
-                    ), 401
+                    return Response(
+                        _INVALID_CREDENTIALS_BODY, status=401, mimetype="application/json"
+                    )
 
             return render_template("login.html")
 
@@ -715,8 +1499,11 @@ class WebApp:
             session_token = request.cookies.get("session_token")
             if session_token:
                 self.db.delete_session(session_token)
+                self._invalidate_session_cache(session_token)
 
-            response = jsonify({"success": True, "redirect": url_for("login")})
+            response = Response(
+                _redirect_body(url_for("login")), mimetype="application/json"
+            )
             response.set_cookie("session_token", "", expires=0)
             return response
 
@@ -772,7 +1559,7 @@ class WebApp:
                 return redirect(url_for("index"))
 
             session_token = request.cookies.get("session_token")
-            user = self.db.get_user_by_session(session_token)
+            user = self._lookup_session(session_token)
             users = self.db.get_all_users() if user and user["is_admin"] else []
 
             return render_template("settings.html", user=user, users=users)
@@ -784,7 +1571,7 @@ class WebApp:
             user = None
             if self.auth_enabled and self.db:
                 session_token = request.cookies.get("session_token")
-                user = self.db.get_user_by_session(session_token)
+                user = self._lookup_session(session_token)
 
             # Load current preferences
             preferences_data = self._load_preferences()
@@ -1058,7 +1845,7 @@ class WebApp:
 
                 # Search aniworld.to
                 try:
-                    url = f"{config.ANIWORLD_TO}/ajax/seriesSearch?keyword={quote(title)}"
+                    url = _ANIWORLD_SEARCH_URL + quote(title)
                     results = fetch_anime_list(url)
                     for anime in results:
                         slug = anime.get("link", "")
@@ -1118,8 +1905,10 @@ class WebApp:
         def api_browse_folder():
             """Open native folder picker dialog and return selected path."""
             try:
-                import tkinter as tk
-                from tkinter import filedialog
+                tk_modules = None if self._folder_picker_unavailable else _load_tkinter()
+                if tk_modules is None:
+                    raise ImportError("tkinter not available")
+                tk, filedialog = tk_modules
 
                 # Get initial directory from request or use current preference
                 data = request.get_json() or {}
@@ -1130,18 +1919,27 @@ class WebApp:
                     prefs = self._load_preferences()
                     initial_dir = prefs.get("download_directory", str(Path.home() / "Downloads"))
 
-                # Create hidden root window
-                root = tk.Tk()
-                root.withdraw()  # Hide the root window
-                root.attributes("-topmost", True)  # Bring dialog to front
-
-                # Open folder picker dialog
-                selected_folder = filedialog.askdirectory(
-                    initialdir=initial_dir,
-                    title="Select Download Directory"
-                )
+                # Tk objects are bound to the thread that created them and
+                # requests run on arbitrary worker threads, so the root is
+                # created per dialog; the lock keeps it to one dialog at once
+                with self._folder_picker_lock:
+                    # Create hidden root window
+                    try:
+                        root = tk.Tk()
+                    except tk.TclError:
+                        self._folder_picker_unavailable = True
+                        raise ImportError("no display available for tkinter")
+                    root.withdraw()  # Hide the root window
+                    root.attributes("-topmost", True)  # Bring dialog to front
 
-                root.destroy()  # Clean up
+                    try:
+                        # Open folder picker dialog
+                        selected_folder = filedialog.askdirectory(
+                            initialdir=initial_dir,
+                            title="Select Download Directory"
+                        )
+                    finally:
+                        root.destroy()  # Clean up
 
                 if selected_folder:
                     return jsonify({"success": True, "path": selected_folder})
@@ -1236,8 +2034,7 @@ class WebApp:
                 ), 500
 
             # Get user info to check if it's the original admin
-            users = self.db.get_all_users()
-            user_to_delete = next((u for u in users if u["id"] == user_id), None)
+            user_to_delete = self.db.get_user_by_id(user_id)
 
             if user_to_delete and user_to_delete.get("is_original_admin"):
                 return jsonify(
@@ -1245,6 +2042,7 @@ class WebApp:
                 ), 400
 
             if self.db.delete_user(user_id):
+                self._invalidate_session_cache()
                 return jsonify(
                     {"success": True, "message": "User deleted successfully"}
                 )
@@ -1278,6 +2076,7 @@ class WebApp:
                 ), 500
 
             if self.db.update_user(user_id, username, password, is_admin):
+                self._invalidate_session_cache()
                 return jsonify(
                     {"success": True, "message": "User updated successfully"}
                 )
@@ -1296,11 +2095,11 @@ class WebApp:
                 ), 400
 
             session_token = request.cookies.get("session_token")
-            user = self.db.get_user_by_session(session_token)
+            user = self._lookup_session(session_token)
             if not user:
                 return jsonify({"success": False, "error": "Invalid session"}), 401
 
-            data = request.get_json()
+            data = _json_body()
             current_password = data.get("current_password", "")
             new_password = data.get("new_password", "")
 
@@ -1350,41 +2149,52 @@ class WebApp:
         def api_info():
             """API info endpoint."""
             uptime_seconds = int(time.time() - self.start_time)
-            uptime_str = self._format_uptime(uptime_seconds)
+            cached_seconds, uptime_str = self._uptime_cache
+            if cached_seconds != uptime_seconds:
+                uptime_str = self._format_uptime(uptime_seconds)
+                self._uptime_cache = (uptime_seconds, uptime_str)
 
-            return jsonify(
+            update_info = self._update_info
+            dynamic = _response_dumps(
                 {
-                    "version": config.VERSION,
-                    "status": "running",
                     "uptime": uptime_str,
-                    "latest_version": self._update_info.get("latest"),
-                    "is_newest": self._update_info.get("is_newest", True),
-                    "supported_providers": list(config.SUPPORTED_PROVIDERS),
-                    "platform": config.PLATFORM_SYSTEM,
+                    "latest_version": update_info.get("latest"),
+                    "is_newest": update_info.get("is_newest", True),
                 }
             )
+            # Splice the two JSON objects: drop the static closing brace and
+            # the dynamic opening brace
+            return Response(
+                self._info_static_bytes[:-1] + b"," + dynamic[1:],
+                mimetype="application/json",
+            )
 
         @self.app.route("/api/media-stats")
         @self._require_api_auth
         def api_media_stats():
             """Return media library statistics."""
-            return jsonify(self._media_stats)
+            # The scan runs in the background; clients poll until scan_complete
+            with self._media_stats_lock:
+                stats = dict(self._media_stats)
+            stats["scan_complete"] = self.scan_complete.is_set()
+            return jsonify(stats)
 
         @self.app.route("/health")
         def health():
             """Health check endpoint."""
-            return jsonify(
-                {"status": "healthy", "timestamp": datetime.now().isoformat()}
-            )
+            now = int(time.time())
+            second, body = self._health_body
+            if second != now:
+                body = _HEALTH_PREFIX + datetime.fromtimestamp(now).isoformat().encode() + _HEALTH_SUFFIX
+                self._health_body = (now, body)
+            return Response(body, mimetype="application/json")
 
         @self.app.route("/api/search", methods=["POST"])
         @self._require_api_auth
         def api_search():
             """Search for anime endpoint."""
             try:
-                from flask import request
-
-                data = request.get_json()
+                data = _json_body()
                 if not data or "query" not in data:
                     return jsonify(
                         {"success": False, "error": "Query parameter is required"}
@@ -1405,154 +2215,103 @@ class WebApp:
                     else:
                         sites = [old_site]
 
-                def search_multi_sites(keyword, sites):
-                    """Search across multiple sites."""
-                    from ..search import fetch_anime_list
-                    from .. import config
-                    from urllib.parse import quote
+                cache_key = (query.lower(), tuple(sorted(sites)))
+                now = time.monotonic()
+                with self._search_cache_lock:
+                    cached = self._search_cache.get(cache_key)
+                if cached and now - cached[0] < _SEARCH_CACHE_TTL:
+                    return _json_response(
+                        {
+                            "success": True,
+                            "results": cached[1],
+                            "count": len(cached[1]),
+                        }
+                    )
+
+                def search_multi_sites(keyword, sites, cap=_SEARCH_RESULT_CAP):
+                    """Search across multiple sites in parallel, returning at most ``cap`` results."""
+                    if not sites:
+                        return []
 
-                    all_results = []
-                    seen_slugs = set()
+                    # (site, fetch, base_url, stream_path, is_movie), in the
+                    # order that decides which site wins a duplicate slug
+                    sources = []
 
                     if "aniworld.to" in sites:
-                        try:
-                            url = f"{config.ANIWORLD_TO}/ajax/seriesSearch?keyword={quote(keyword)}"
-                            results = fetch_anime_list(url)
-                            for anime in results:
-                                slug = anime.get("link", "")
-                                if slug and slug not in seen_slugs:
-                                    anime["site"] = "aniworld.to"
-                                    anime["base_url"] = config.ANIWORLD_TO
-                                    anime["stream_path"] = "anime/stream"
-                                    all_results.append(anime)
-                                    seen_slugs.add(slug)
-                        except Exception as e:
-                            logging.warning(f"Failed to fetch from aniworld: {e}")
+                        url = _ANIWORLD_SEARCH_URL + quote(keyword)
+                        sources.append(
+                            ("aniworld.to", lambda: fetch_anime_list(url),
+                             config.ANIWORLD_TO, "anime/stream", False)
+                        )
 
                     if "s.to" in sites:
-                        try:
-                            from ..search import fetch_sto_search_results
-                            results = fetch_sto_search_results(keyword)
-                            for anime in results:
-                                slug = anime.get("link", "")
-                                if slug and slug not in seen_slugs:
-                                    anime["site"] = "s.to"
-                                    anime["base_url"] = config.S_TO
-                                    anime["stream_path"] = "serie"
-                                    all_results.append(anime)
-                                    seen_slugs.add(slug)
-                        except Exception as e:
-                            logging.warning(f"Failed to fetch from s.to: {e}")
+                        sources.append(
+                            ("s.to", lambda: fetch_sto_search_results(keyword),
+                             config.S_TO, "serie", False)
+                        )
 
                     if "movie4k.sx" in sites:
-                        import concurrent.futures as _cf
-                        from ..sites.movie4k import fetch_movie4k_search_results
-                        from ..sites.huhu import fetch_huhu_search_results as _fetch_huhu
-
-                        def _search_movie4k(kw):
-                            return fetch_movie4k_search_results(kw)
-
-                        def _search_huhu(kw):
-                            return _fetch_huhu(kw)
+                        sources.append(
+                            ("movie4k.sx", lambda: fetch_movie4k_search_results(keyword),
+                             config.MOVIE4K_SX, "watch", True)
+                        )
+                        sources.append(
+                            ("huhu.to", lambda: fetch_huhu_search_results(keyword),
+                             config.HUHU_TO, "web-vod/item", True)
+                        )
 
-                        with _cf.ThreadPoolExecutor(max_workers=2) as _pool:
-                            _f_m4k = _pool.submit(_search_movie4k, keyword)
-                            _f_huhu = _pool.submit(_search_huhu, keyword)
+                    # Fetch all sites at once; merge on this thread in source order
+                    futures = [
+                        (source, self._search_pool.submit(source[1]))
+                        for source in sources
+                    ]
 
-                            try:
-                                movie_results = _f_m4k.result(timeout=30)
-                                for movie in movie_results:
-                                    link = movie.get("link", "")
-                                    if link and link not in seen_slugs:
-                                        movie["site"] = "movie4k.sx"
-                                        movie["base_url"] = config.MOVIE4K_SX
-                                        movie["stream_path"] = "watch"
-                                        movie["type"] = "movie"
-                                        movie["is_movie"] = True
-                                        all_results.append(movie)
-                                        seen_slugs.add(link)
-                            except Exception as e:
-                                logging.warning(f"Failed to fetch from movie4k.sx: {e}")
+                    # One {slug: result} map per site, tagged with where it came from
+                    site_maps = []
+                    for (site, _, base_url, stream_path, is_movie), future in futures:
+                        try:
+                            results = future.result(timeout=30)
+                        except Exception as e:
+                            logging.warning(f"Failed to fetch from {site}: {e}")
+                            continue
 
-                            try:
-                                huhu_results = _f_huhu.result(timeout=30)
-                                for movie in huhu_results:
-                                    link = movie.get("link", "")
-                                    if link and link not in seen_slugs:
-                                        movie["site"] = "huhu.to"
-                                        movie["base_url"] = config.HUHU_TO
-                                        movie["stream_path"] = "web-vod/item"
-                                        movie["type"] = "movie"
-                                        movie["is_movie"] = True
-                                        all_results.append(movie)
-                                        seen_slugs.add(link)
-                            except Exception as e:
-                                logging.warning(f"Failed to fetch from huhu.to: {e}")
+                        extra = {"site": site, "base_url": base_url, "stream_path": stream_path}
+                        if is_movie:
+                            extra["type"] = "movie"
+                            extra["is_movie"] = True
+                        # First hit wins a slug the site returns twice; unique
+                        # hits past the cap can never make the combined cut
+                        site_map = {}
+                        for anime in results:
+                            link = anime.get("link")
+                            if link and link not in site_map:
+                                site_map[link] = {**anime, **extra}
+                                if len(site_map) >= cap:
+                                    break
+                        site_maps.append(site_map)
 
-                    return all_results
+                    # Merging last-to-first lets the earliest site win a
+                    # duplicate slug; results keep first-seen order
+                    merged = {}
+                    for site_map in reversed(site_maps):
+                        merged |= site_map
+                    order = dict.fromkeys(chain.from_iterable(site_maps))
+                    return [merged[slug] for slug in islice(order, cap)]
 
                 results = search_multi_sites(query, sites)
 
                 # Process results
-                processed_results = []
-                for anime in results[:50]:
-                    link = anime.get("link", "")
-                    anime_site = anime.get("site", "aniworld.to")
-                    anime_base_url = anime.get("base_url", config.ANIWORLD_TO)
-                    anime_stream_path = anime.get("stream_path", "anime/stream")
+                processed_results = [_build_result(anime) for anime in results]
 
-                    if link and not link.startswith("http"):
-                        full_url = f"{anime_base_url}/{anime_stream_path}/{link}"
-                    else:
-                        full_url = link
-
-                    name = anime.get("name", "Unknown Name")
-                    year = anime.get("productionYear", "Unknown Year")
-
-                    if year and year != "Unknown Year" and str(year) not in name:
-                        title = f"{name} {year}"
-                    else:
-                        title = name
-
-                    # Determine a proper slug for movies (use the slug part, not the movie id)
-                    if anime_site == "movie4k.sx" and full_url and "/watch/" in full_url:
-                        try:
-                            parts = full_url.rstrip("/").split("/")
-                            # expected: ... /watch/{slug}/{id}
-                            slug_val = parts[-2] if len(parts) >= 2 else link
-                        except Exception:
-                            slug_val = link
-                    elif anime_site == "huhu.to":
-                        # URL is https://huhu.to/web-vod/item?id=movie.911430
-                        # Use the movie ID (with dots replaced) as slug
-                        try:
-                            from urllib.parse import urlparse as _up, parse_qs as _pqs
-                            _parsed = _up(full_url)
-                            _params = _pqs(_parsed.query)
-                            _movie_id = _params.get("id", ["unknown"])[0]
-                            slug_val = _movie_id.replace(".", "_")
-                        except Exception:
-                            slug_val = link.split("=")[-1] if "=" in link else link
-                    else:
-                        slug_val = link if not link.startswith("http") else link.split("/")[-1]
-
-                    processed_anime = {
-                        "title": title,
-                        "url": full_url,
-                        "description": anime.get("description", ""),
-                        "slug": slug_val,
-                        "name": name,
-                        "year": year,
-                        "site": anime_site,
-                        "cover": anime.get("cover", ""),
-                        # Propagate type information so the UI can render movies differently
-                        "type": anime.get("type", "series"),
-                        "is_movie": bool(anime.get("is_movie", False)),
-                    }
-
-                    processed_results.append(processed_anime)
+                # Empty results are not cached so a site outage isn't remembered
+                if processed_results:
+                    with self._search_cache_lock:
+                        self._search_cache[cache_key] = (now, processed_results)
+                        self._search_cache.move_to_end(cache_key)
+                        while len(self._search_cache) > _SEARCH_CACHE_MAX:
+                            self._search_cache.popitem(last=False)
 
-                return jsonify(
+                return _json_response(
                     {
                         "success": True,
                         "results": processed_results,
@@ -1566,16 +2325,20 @@ class WebApp:
                     {"success": False, "error": f"Search failed: {str(err)}"}
                 ), 500
 
+        # Direct URL handlers by host; movie4k mirrors share one entry
+        direct_handlers = {
+            "movie4k": self._direct_movie4k,
+            "huhu.to": self._direct_huhu,
+            "s.to": self._direct_series,
+            "aniworld.to": self._direct_series,
+        }
+
         @self.app.route("/api/direct", methods=["POST"])
         @self._require_api_auth
         def api_direct():
             """Handle direct URL input endpoint."""
             try:
-                from flask import request
-                from urllib.parse import urlparse
-                from .. import config
-
-                data = request.get_json()
+                data = _json_body()
                 if not data or "url" not in data:
                     return jsonify(
                         {"success": False, "error": "URL parameter is required"}
@@ -1589,16 +2352,8 @@ class WebApp:
 
                 # Validate and parse the URL
                 try:
-                    parsed_url = urlparse(url)
-                    domain = parsed_url.netloc.lower()
-
-                    # Check if URL is from a supported site
-                    is_movie4k = "movie4k" in domain
-                    is_sto = "s.to" in domain
-                    is_aniworld = "aniworld.to" in domain
-                    is_huhu = "huhu.to" in domain
-
-                    if not is_movie4k and not is_sto and not is_aniworld and not is_huhu:
+                    match = _DIRECT_URL_RE.match(url)
+                    if not match:
                         return jsonify(
                             {
                                 "success": False,
@@ -1606,197 +2361,9 @@ class WebApp:
                             }
                         ), 400
 
-                    # Handle movie4k.sx direct URLs via API
-                    if is_movie4k:
-                        path_parts = [p for p in parsed_url.path.split("/") if p]
-                        # Expected: /watch/{slug}/{movie_id}
-                        if len(path_parts) >= 3 and path_parts[0] == "watch":
-                            slug = path_parts[1]
-                            movie_id = path_parts[2]
-                        else:
-                            return jsonify(
-                                {"success": False, "error": "Invalid movie4k.sx URL format"}
-                            ), 400
-
-                        try:
-                            import requests as req
-                            api_url = f"{config.MOVIE4K_SX}/data/watch/?_id={movie_id}"
-                            resp = req.get(
-                                api_url,
-                                timeout=config.DEFAULT_REQUEST_TIMEOUT,
-                                headers={
-                                    "User-Agent": config.RANDOM_USER_AGENT,
-                                    "Accept": "application/json",
-                                },
-                            )
-                            resp.raise_for_status()
-                            movie_data = resp.json()
-
-                            title = movie_data.get("title", slug.replace("-", " ").title())
-                            year = movie_data.get("year", "")
-                            if year and str(year) not in title:
-                                display_title = f"{title} ({year})"
-                            else:
-                                display_title = title
-
-                            poster = movie_data.get("poster_path", "")
-                            cover = f"https://image.tmdb.org/t/p/w220_and_h330_face{poster}" if poster else ""
-
-                            anime_result = {
-                                "title": display_title,
-                                "url": url,
-                                "slug": slug,
-                                "site": "movie4k.sx",
-                                "description": movie_data.get("storyline", movie_data.get("overview", "")),
-                                "cover": cover,
-                            }
-                        except Exception as movie_err:
-                            logging.warning(f"Failed to fetch movie4k.sx details: {movie_err}")
-                            anime_result = {
-                                "title": slug.replace("-", " ").title(),
-                                "url": url,
-                                "slug": slug,
-                                "site": "movie4k.sx",
-                                "description": "",
-                                "cover": "",
-                            }
-
-                        return jsonify(
-                            {
-                                "success": True,
-                                "result": anime_result,
-                                "source": "direct_url",
-                            }
-                        )
-
-                    # Handle huhu.to direct URLs
-                    if is_huhu:
-                        from ..sites.huhu import HuhuMovie as _HuhuMovieDirect
-                        try:
-                            movie_obj = _HuhuMovieDirect(url=url)
-                            anime_result = {
-                                "title": movie_obj.title,
-                                "url": url,
-                                "slug": movie_obj.slug,
-                                "site": "huhu.to",
-                                "description": movie_obj.overview or "",
-                                "cover": movie_obj.cover or "",
-                            }
-                        except Exception as huhu_err:
-                            logging.warning(f"Failed to fetch huhu.to details: {huhu_err}")
-                            # Best-effort fallback from URL query params
-                            try:
-                                from urllib.parse import parse_qs as _pqs2
-                                _params2 = _pqs2(parsed_url.query)
-                                _movie_id = _params2.get("id", ["unknown"])[0]
-                            except Exception:
-                                _movie_id = "unknown"
-                            anime_result = {
-                                "title": _movie_id.replace("movie.", "").replace(".", " ").title(),
-                                "url": url,
-                                "slug": _movie_id.replace(".", "_"),
-                                "site": "huhu.to",
-                                "description": "",
-                                "cover": "",
-                            }
-                        return jsonify(
-                            {
-                                "success": True,
-                                "result": anime_result,
-                                "source": "direct_url",
-                            }
-                        )
-
-                    # Determine site and stream path for aniworld/s.to
-                    if is_sto:
-                        site = "s.to"
-                        base_url = config.S_TO
-                        stream_path = "serie"
-                    else:
-                        site = "aniworld.to"
-                        base_url = config.ANIWORLD_TO
-                        stream_path = "anime/stream"
-
-                    # Extract slug from URL (last part of path)
-                    path_parts = [p for p in parsed_url.path.split("/") if p]
-                    if not path_parts:
-                        return jsonify(
-                            {"success": False, "error": "Invalid URL format"}
-                        ), 400
-
-                    slug = path_parts[-1]
-
-                    # Use search functionality to get the full anime details
-                    from ..search import fetch_anime_list
-
-                    try:
-                        search_query = slug.replace("-", " ")
-
-                        if site == "s.to":
-                            from ..search import fetch_sto_search_results
-                            search_results = fetch_sto_search_results(search_query)
-                        else:
-                            search_url = f"{config.ANIWORLD_TO}/ajax/seriesSearch?keyword={search_query}"
-                            search_results = fetch_anime_list(search_url)
-
-                        matching_anime = None
-                        for anime in search_results:
-                            if anime.get("link", "").strip() == slug:
-                                matching_anime = anime
-                                break
-
-                        if matching_anime:
-                            name = matching_anime.get("name", slug.replace("-", " ").title())
-                            year = matching_anime.get("productionYear", "")
-
-                            if year and year != "Unknown Year" and str(year) not in name:
-                                title = f"{name} {year}"
-                            else:
-                                title = name
-
-                            anime_result = {
-                                "title": title,
-                                "url": url,
-                                "slug": slug,
-                                "site": site,
-                                "description": matching_anime.get("description", ""),
-                                "cover": matching_anime.get("cover", ""),
-                            }
-                        else:
-                            anime_result = {
-                                "title": slug.replace("-", " ").title(),
-                                "url": url,
-                                "slug": slug,
-                                "site": site,
-                                "description": "",
-                                "cover": "",
-                            }
-
-                        return jsonify(
-                            {
-                                "success": True,
-                                "result": anime_result,
-                                "source": "direct_url",
-                            }
-                        )
-
-                    except Exception as search_err:
-                        logging.warning(f"Failed to fetch details from search for direct URL: {search_err}")
-                        anime_result = {
-                            "title": slug.replace("-", " ").title(),
-                            "url": url,
-                            "slug": slug,
-                            "site": site,
-                            "description": "",
-                            "cover": "",
-                        }
-                        return jsonify(
-                            {
-                                "success": True,
-                                "result": anime_result,
-                                "source": "direct_url",
-                            }
-                        )
+                    host = match["host"].lower()
+                    handler = direct_handlers["movie4k" if host.startswith("movie4k.") else host]
+                    return handler(url, host, match["path"] or "", match["query"] or "")
 
                 except Exception as url_err:
                     logging.error(f"URL parsing error: {url_err}")
@@ -1817,7 +2384,7 @@ class WebApp:
             try:
                 from flask import request
 
-                data = request.get_json()
+                data = _json_body()
 
                 # Check for both single episode (legacy) and multiple episodes (new)
                 episode_urls = data.get("episode_urls", [])
@@ -1844,19 +2411,25 @@ class WebApp:
                 current_user = None
                 if self.auth_enabled and self.db:
                     session_token = request.cookies.get("session_token")
-                    current_user = self.db.get_user_by_session(session_token)
+                    current_user = self._lookup_session(session_token)
 
                 # Determine anime title
                 anime_title = data.get("anime_title", "Unknown Anime")
 
-                # Calculate total episodes by checking episode URLs
-                from ..entry import _group_episodes_by_series
-
+                # Calculate total episodes by checking episode URLs; large
+                # batches are grouped in parallel slices (only the total is
+                # needed, so a series split across slices still counts right)
                 try:
-                    anime_list = _group_episodes_by_series(episode_urls)
-                    total_episodes = sum(
-                        len(anime.episode_list) for anime in anime_list
-                    )
+                    chunks = [
+                        episode_urls[i:i + _GROUP_CHUNK_SIZE]
+                        for i in range(0, len(episode_urls), _GROUP_CHUNK_SIZE)
+                    ]
+                    if len(chunks) == 1:
+                        total_episodes = _count_grouped_episodes(episode_urls)
+                    else:
+                        total_episodes = sum(
+                            self._search_pool.map(_count_grouped_episodes, chunks)
+                        )
                 except Exception as e:
                     logging.error(f"Failed to process episode URLs: {e}")
                     return jsonify(
@@ -1891,7 +2464,6 @@ class WebApp:
 
                 # Save series metadata for file browser
                 try:
-                    import json as json_mod
                     download_path = str(config.DEFAULT_DOWNLOAD_PATH)
                     if (
                         self.arguments
@@ -1927,7 +2499,7 @@ class WebApp:
                     from ..action.common import sanitize_filename
                     meta_path = Path(download_path) / sanitize_filename(anime_title) / ".series_meta.json"
                     meta_path.parent.mkdir(parents=True, exist_ok=True)
-                    meta_path.write_text(json_mod.dumps(meta, ensure_ascii=False), encoding="utf-8")
+                    meta_path.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
 
                     # Download and save cover image locally (TMDB primary, site URL fallback)
                     cover_url = data.get("cover", "")
@@ -1978,8 +2550,6 @@ class WebApp:
         def api_episodes():
             """Get episodes for a series endpoint."""
             try:
-                from flask import request
-
                 data = request.get_json()
                 if not data or "series_url" not in data:
                     return jsonify(
@@ -1988,32 +2558,19 @@ class WebApp:
 
                 series_url = data["series_url"]
                 folder_path = data.get("folder_path", "")
+                force_refresh = bool(data.get("force_refresh", False))
 
                 # Create wrapper function to handle all logic
                 def get_episodes_for_series(series_url):
                     """Wrapper function using existing functions to get episodes and movies"""
-                    from ..common import (
-                        get_season_episode_count,
-                        get_movie_episode_count,
-                        get_episode_titles,
-                    )
-                    from ..entry import _detect_site_from_url
-                    from .. import config
-
-                    # Extract slug and site using existing functions
-                    _site = _detect_site_from_url(series_url)
-
-                    if "/anime/stream/" in series_url:
-                        slug = series_url.split("/anime/stream/")[-1].rstrip("/")
-                        stream_path = "anime/stream"
-                        base_url = config.ANIWORLD_TO
-                    elif "/serie/" in series_url:
-                        slug = series_url.split("/serie/")[-1].rstrip("/")
-                        stream_path = "serie"
-                        base_url = config.S_TO
+                    # Extract slug and site from the series URL
+                    series_match = _SERIES_RE.search(series_url)
+                    if series_match:
+                        slug = series_match["slug"]
+                        stream_path = series_match["stream_path"]
+                        base_url = _SERIES_BASE_URLS[stream_path]
                     else:
                         # Special-case movie URLs (movie4k.sx uses /watch/{slug}/{id})
-                        from ..sites.movie4k import Movie as Movie4kMovie
                         if "/watch/" in series_url or "movie4k.sx" in series_url:
                             # Use Movie wrapper to get title and provide as a single movie entry
                             movie_description = ""
@@ -2028,10 +2585,9 @@ class WebApp:
 
                         # huhu.to movie URLs: https://huhu.to/web-vod/item?id=movie.{tmdb_id}
                         if "huhu.to" in series_url:
-                            from ..sites.huhu import HuhuMovie as _HuhuMovie
                             movie_description = ""
                             try:
-                                movie_obj = _HuhuMovie(url=series_url)
+                                movie_obj = HuhuMovie(url=series_url)
                                 movie_title = movie_obj.title
                                 movie_description = movie_obj.overview or ""
                             except Exception:
@@ -2040,10 +2596,39 @@ class WebApp:
 
                         raise ValueError("Invalid series URL format")
 
-                    # Use existing function to get season/episode counts
+                    # Episode lists rarely change; reuse a recent scrape unless
+                    # the client asks for fresh data
+                    cache_key = (base_url, slug)
+                    if force_refresh:
+                        # Also drop the scraper-level caches underneath
+                        clear_series_cache(slug, base_url)
+                    else:
+                        with self._episodes_cache_lock:
+                            cached = self._episodes_cache.get(cache_key)
+                        if cached and time.monotonic() - cached[0] < config.EPISODES_CACHE_TTL:
+                            return _copy_series_episodes(*cached[1])
+
+                    # The movie count and the description are independent page
+                    # fetches; run them alongside the season scrape
+                    has_movies = base_url in (config.ANIWORLD_TO, config.S_TO)
+                    pool = self._episodes_pool
+                    movies_future = (
+                        pool.submit(get_movie_episode_count, slug, link=base_url)
+                        if has_movies
+                        else None
+                    )
+                    description_future = pool.submit(
+                        _fetch_series_description, f"{base_url}/{stream_path}/{slug}"
+                    )
+
+                    # Titles come from the same season pages as the counts, so
+                    # they are fetched after them and served from the page caches
                     season_counts = get_season_episode_count(slug, base_url)
 
-                    # Fetch episode titles from season pages
+                    # Only a scrape where every part succeeded is cached, so a
+                    # transient failure isn't served for the whole cache TTL
+                    complete = any(count > 0 for count in season_counts.values())
+
                     try:
                         episode_titles = get_episode_titles(slug, base_url)
                     except Exception as e:
@@ -2052,31 +2637,30 @@ class WebApp:
                             slug, e
                         )
                         episode_titles = {}
+                        complete = False
 
                     # Build episodes structure
+                    url_template = f"{base_url}/{stream_path}/{slug}/staffel-%d/episode-%d"
                     episodes_by_season = {}
                     for season_num, episode_count in season_counts.items():
                         if episode_count > 0:
                             season_titles = episode_titles.get(season_num, {})
-                            episodes_by_season[season_num] = []
-                            for ep_num in range(1, episode_count + 1):
-                                title = season_titles.get(
-                                    ep_num, f"Episode {ep_num}"
-                                )
-                                episodes_by_season[season_num].append(
-                                    {
-                                        "season": season_num,
-                                        "episode": ep_num,
-                                        "title": title,
-                                        "url": f"{base_url}/{stream_path}/{slug}/staffel-{season_num}/episode-{ep_num}",
-                                    }
-                                )
+                            episodes_by_season[season_num] = [
+                                {
+                                    "season": season_num,
+                                    "episode": ep_num,
+                                    "title": season_titles.get(ep_num, f"Episode {ep_num}"),
+                                    "url": url_template % (season_num, ep_num),
+                                }
+                                for ep_num in range(1, episode_count + 1)
+                            ]
 
                     # Get movies for aniworld.to and s.to
                     movies = []
-                    if base_url in (config.ANIWORLD_TO, config.S_TO):
+                    if has_movies:
                         try:
-                            movie_count = get_movie_episode_count(slug, link=base_url)
+                            # Bounded by the fetch's own HTTP timeout
+                            movie_count = movies_future.result()
                             for movie_num in range(1, movie_count + 1):
                                 movies.append(
                                     {
@@ -2089,6 +2673,7 @@ class WebApp:
                             logging.warning(
                                 f"Failed to get movie count for {slug}: {e}"
                             )
+                            complete = False
 
                     # Fallback if no seasons found
                     if not episodes_by_season:
@@ -2101,45 +2686,43 @@ class WebApp:
                             }
                         ]
 
-                    # Fetch description from series page
-                    series_description = ""
                     try:
-                        import requests as req_lib
-                        series_page_url = f"{base_url}/{stream_path}/{slug}"
-                        resp = req_lib.get(
-                            series_page_url,
-                            timeout=config.DEFAULT_REQUEST_TIMEOUT,
-                            headers={"User-Agent": config.RANDOM_USER_AGENT},
-                        )
-                        if resp.ok:
-                            from bs4 import BeautifulSoup
-                            soup = BeautifulSoup(resp.content, "html.parser")
-                            desc_el = soup.find("p", class_="seri_des")
-                            if not desc_el:
-                                desc_el = soup.find(class_="seri_des") or soup.find(class_="description-text")
-                            if desc_el:
-                                series_description = desc_el.get("data-full-description", "") or desc_el.get_text(strip=True)
+                        series_description = description_future.result()
                     except Exception as e:
-                        logging.warning("Failed to fetch series description: %s", e)
+                        logging.warning(
+                            "Failed to fetch series description for %s: %s",
+                            slug, e
+                        )
+                        series_description = ""
+                        complete = False
+
+                    # Callers annotate the episode dicts, so the cache keeps its own copy
+                    if complete:
+                        with self._episodes_cache_lock:
+                            self._episodes_cache[cache_key] = (
+                                time.monotonic(),
+                                _copy_series_episodes(
+                                    episodes_by_season, movies, slug, series_description
+                                ),
+                            )
+                            self._episodes_cache.move_to_end(cache_key)
+                            while len(self._episodes_cache) > _EPISODES_CACHE_MAX:
+                                self._episodes_cache.popitem(last=False)
 
                     return episodes_by_season, movies, slug, series_description
 
                 def scan_available_providers(sample_url, site):
                     """Scan a sample episode URL for available providers and languages."""
-                    from ..models import Episode
-                    from ..config import SUPPORTED_PROVIDERS, SITE_LANGUAGE_NAMES
-
                     available_providers = []
                     available_languages = []
                     try:
                         # movie4k.sx uses Movie class with API-based data
                         if site == "movie4k.sx":
-                            from ..sites.movie4k import Movie
                             try:
-                                movie = Movie(url=sample_url)
+                                movie = Movie4kMovie(url=sample_url)
                                 available_providers = [
                                     p for p in movie.provider_names
-                                    if p in SUPPORTED_PROVIDERS
+                                    if p in config.SUPPORTED_PROVIDERS
                                 ]
                                 available_languages = movie.available_languages
                             except Exception as e:
@@ -2148,9 +2731,8 @@ class WebApp:
 
                         # huhu.to uses HuhuMovie (no named providers exposed)
                         if site == "huhu.to":
-                            from ..sites.huhu import HuhuMovie as _HuhuMovieScan
                             try:
-                                movie = _HuhuMovieScan(url=sample_url)
+                                movie = HuhuMovie(url=sample_url)
                                 available_providers = movie.provider_names  # []
                                 available_languages = movie.available_languages
                             except Exception as e:
@@ -2166,7 +2748,7 @@ class WebApp:
                         # Filter to only supported providers, preserve order
                         available_providers = [
                             p for p in providers.keys()
-                            if p in SUPPORTED_PROVIDERS
+                            if p in config.SUPPORTED_PROVIDERS
                         ]
 
                         # Extract available languages from provider data
@@ -2174,7 +2756,7 @@ class WebApp:
                         for lang_map in providers.values():
                             lang_keys.update(lang_map.keys())
 
-                        lang_names = SITE_LANGUAGE_NAMES.get(site, {})
+                        lang_names = config.SITE_LANGUAGE_NAMES.get(site, {})
                         available_languages = [
                             lang_names[k] for k in sorted(lang_keys)
                             if k in lang_names
@@ -2227,7 +2809,6 @@ class WebApp:
 
                 # Scan for local files - auto-detect folder if not provided
                 local_files = {}
-                import re as re_mod
                 download_path = str(config.DEFAULT_DOWNLOAD_PATH)
                 if (
                     self.arguments
@@ -2246,8 +2827,7 @@ class WebApp:
                         meta_file = candidate / ".series_meta.json"
                         if meta_file.exists():
                             try:
-                                import json as json_auto
-                                meta = json_auto.loads(meta_file.read_text(encoding="utf-8"))
+                                meta = json.loads(meta_file.read_text(encoding="utf-8"))
                                 meta_url = meta.get("url", "")
                                 # Match by URL (strip trailing slashes and season/episode paths)
                                 series_base = series_url.split("/staffel-")[0].split("/filme/")[0].rstrip("/")
@@ -2266,27 +2846,27 @@ class WebApp:
                                 break
 
                 target_dir = download_dir / folder_path if folder_path else None
-                video_exts = {'.mp4', '.mkv', '.avi', '.webm', '.mov', '.m4v', '.flv', '.wmv'}
+                video_exts = _VIDEO_EXT
                 if target_dir and target_dir.exists():
                     for f in target_dir.rglob("*"):
                         if f.is_file() and f.suffix.lower() in video_exts:
                             rel_path = str(f.relative_to(download_dir))
                             # Try S##E## pattern in filename first
-                            match = re_mod.search(r'S(\d+)E(\d+)', f.name, re_mod.IGNORECASE)
+                            match = re.search(r'S(\d+)E(\d+)', f.name, re.IGNORECASE)
                             if match:
                                 s_num, e_num = int(match.group(1)), int(match.group(2))
                                 local_files[f"{s_num}-{e_num}"] = rel_path
                                 continue
                             # Try "Season X/Episode YYY.mp4" pattern (actual download format)
-                            season_match = re_mod.search(r'Season\s+(\d+)', f.parent.name, re_mod.IGNORECASE)
-                            ep_match = re_mod.search(r'Episode\s+(\d+)', f.name, re_mod.IGNORECASE)
+                            season_match = re.search(r'Season\s+(\d+)', f.parent.name, re.IGNORECASE)
+                            ep_match = re.search(r'Episode\s+(\d+)', f.name, re.IGNORECASE)
                             if season_match and ep_match:
                                 s_num = int(season_match.group(1))
                                 e_num = int(ep_match.group(1))
                                 local_files[f"{s_num}-{e_num}"] = rel_path
                                 continue
                             # Try "Movies/Movie YYY.mp4" pattern
-                            movie_match = re_mod.search(r'Movie\s+(\d+)', f.name, re_mod.IGNORECASE)
+                            movie_match = re.search(r'Movie\s+(\d+)', f.name, re.IGNORECASE)
                             if movie_match:
                                 local_files[f"movie-{int(movie_match.group(1))}"] = rel_path
                                 continue
@@ -2320,16 +2900,22 @@ class WebApp:
                             if not found:
                                 movie["local"] = False
 
-                return jsonify(
-                    {
-                        "success": True,
-                        "episodes": episodes_by_season,
-                        "movies": movies,
-                        "slug": slug,
-                        "description": description,
-                        "available_providers": available_providers,
-                        "available_languages": available_languages,
-                    }
+                # Long series hold thousands of episode dicts; stream them a
+                # season at a time instead of encoding one big body
+                return Response(
+                    _iter_json_object(
+                        {
+                            "success": True,
+                            "slug": slug,
+                            "description": description,
+                            "available_providers": available_providers,
+                            "available_languages": available_languages,
+                            "movies": movies,
+                            "episodes": episodes_by_season,
+                        },
+                        "episodes",
+                    ),
+                    mimetype="application/json",
                 )
 
             except Exception as err:
@@ -2369,28 +2955,29 @@ class WebApp:
             """Shared handler for popular/new endpoints with daily caching."""
             from datetime import date as _date
             force = request.args.get("force", "false").lower() == "true"
-            today = _date.today().isoformat()
+            today = _date.today()
 
             if not force:
                 with self._popular_cache_lock:
                     entry = self._popular_cache.get(cache_key, {})
-                    if entry.get("date") == today and entry.get("data"):
-                        data = entry["data"]
-                        return jsonify({
-                            "success": True,
-                            "popular": data.get("popular", []),
-                            "new": data.get("new", []),
-                        })
+                    if entry.get("data"):
+                        try:
+                            age = (today - _date.fromisoformat(entry.get("date", ""))).days
+                        except (TypeError, ValueError):
+                            age = None
+                        if age == 0:
+                            return self._popular_response(cache_key, entry)
+                        # Serve yesterday's lists right away and refresh behind them
+                        if age is not None and 0 < age <= _POPULAR_STALE_DAYS:
+                            if cache_key not in self._popular_fetches:
+                                self._popular_pool.submit(
+                                    self._refresh_popular, cache_key, fetch_fn
+                                )
+                            return self._popular_response(cache_key, entry)
             try:
-                fetched = fetch_fn()
+                entry = self._fetch_popular(cache_key, fetch_fn)
                 with self._popular_cache_lock:
-                    self._popular_cache[cache_key] = {"data": fetched, "date": today}
-                    self._save_popular_cache()
-                return jsonify({
-                    "success": True,
-                    "popular": fetched.get("popular", []),
-                    "new": fetched.get("new", []),
-                })
+                    return self._popular_response(cache_key, entry)
             except Exception as e:
                 logging.error("Failed to fetch popular/new %s: %s", error_label, e)
                 return jsonify({
@@ -2479,20 +3066,33 @@ class WebApp:
                         "files": []
                     })
 
-                video_extensions = {'.mp4', '.mkv', '.avi', '.webm', '.mov', '.m4v', '.flv', '.wmv'}
+                video_extensions = _VIDEO_EXT
                 folders = []
                 files = []
 
                 # List immediate children (folders and video files)
                 logging.debug(f"/api/files: Scanning directory: {current_dir}")
-                items_found = list(current_dir.iterdir())
+                with os.scandir(current_dir) as entries:
+                    items_found = list(entries)
                 logging.debug(f"/api/files: Found {len(items_found)} items in directory")
 
-                for item in items_found:
+                # Start counting video files in every folder (recursively) up front
+                folder_counts = {}
+                for entry in items_found:
+                    try:
+                        if entry.is_dir():
+                            folder_counts[entry.path] = self._files_pool.submit(
+                                self._count_video_files_recursive, Path(entry.path), video_extensions
+                            )
+                    except OSError as item_error:
+                        logging.warning(f"/api/files: Error processing item '{entry.path}': {item_error}")
+
+                for entry in items_found:
+                    item = Path(entry.path)
                     try:
-                        if item.is_dir():
-                            # Count video files in this folder (recursively)
-                            video_count = self._count_video_files_recursive(item, video_extensions)
+                        count_future = folder_counts.get(entry.path)
+                        if count_future is not None:
+                            video_count = count_future.result()
                             logging.debug(f"/api/files: Folder '{item.name}' has {video_count} videos")
 
                             if video_count > 0:  # Only show folders with videos
@@ -2502,8 +3102,7 @@ class WebApp:
                                 meta_file = item / ".series_meta.json"
                                 if meta_file.exists():
                                     try:
-                                        import json as json_mod
-                                        folder_meta = json_mod.loads(meta_file.read_text(encoding="utf-8"))
+                                        folder_meta = json.loads(meta_file.read_text(encoding="utf-8"))
                                     except Exception:
                                         pass
                                 # Check for local cover image
@@ -2568,9 +3167,9 @@ class WebApp:
                                     "series_url": folder_meta.get("url", ""),
                                     "site": _meta_site,
                                 })
-                        elif item.is_file() and item.suffix.lower() in video_extensions:
+                        elif entry.is_file() and item.suffix.lower() in video_extensions:
                             try:
-                                stat = item.stat()
+                                stat = entry.stat()
                                 relative_path = item.relative_to(download_dir)
                                 files.append({
                                     "name": item.name,
@@ -2930,6 +3529,11 @@ class WebApp:
                 # Delete the file
                 full_path.unlink()
 
+                # Drop cached video counts of the folders that contained it
+                with self._video_count_lock:
+                    for parent in full_path.parents:
+                        self._video_count_cache.pop(str(parent), None)
+
                 return jsonify({
                     "success": True,
                     "message": "File deleted successfully"
@@ -3153,9 +3757,7 @@ class WebApp:
         def api_chromecast_discover():
             """Discover Chromecast devices on the network."""
             try:
-                try:
-                    import pychromecast
-                except ImportError:
+                if pychromecast is None:
                     return jsonify({
                         "success": False,
                         "error": "pychromecast not installed. Install with: pip install pychromecast",
@@ -3200,9 +3802,7 @@ class WebApp:
         def api_chromecast_cast():
             """Cast a video to a Chromecast device."""
             try:
-                try:
-                    import pychromecast
-                except ImportError:
+                if pychromecast is None:
                     return jsonify({
                         "success": False,
                         "error": "pychromecast not installed"
@@ -3295,9 +3895,7 @@ class WebApp:
         def api_chromecast_control():
             """Control Chromecast playback."""
             try:
-                try:
-                    import pychromecast
-                except ImportError:
+                if pychromecast is None:
                     return jsonify({
                         "success": False,
                         "error": "pychromecast not installed"
@@ -3370,9 +3968,7 @@ class WebApp:
         def api_chromecast_status():
             """Get Chromecast playback status."""
             try:
-                try:
-                    import pychromecast
-                except ImportError:
+                if pychromecast is None:
                     return jsonify({
                         "success": False,
                         "error": "pychromecast not installed"
@@ -3491,6 +4087,8 @@ class WebApp:
     def _count_video_files_recursive(self, directory: Path, video_extensions: set) -> int:
         """
         Safely count video files in a directory recursively.
+
+        The last count is reused while no directory in the tree has changed.
         
         Args:
             directory: The directory to scan
@@ -3499,26 +4097,55 @@ class WebApp:
         Returns:
             The count of video files found
         """
+        key = os.fspath(directory)
+        with self._video_count_lock:
+            cached = self._video_count_cache.get(key)
+        # Adding or removing an entry bumps its directory's mtime, so the
+        # cached count holds while every walked directory is unchanged
+        if cached is not None:
+            dir_mtimes, count = cached
+            try:
+                if all(os.stat(path).st_mtime_ns == mtime for path, mtime in dir_mtimes):
+                    return count
+            except OSError:
+                pass
+
         count = 0
-        try:
-            for path in directory.rglob('*'):
-                try:
-                    if path.is_file() and path.suffix.lower() in video_extensions:
-                        count += 1
-                except (OSError, PermissionError):
-                    # Skip files we can't access
-                    pass
-        except (OSError, PermissionError) as e:
-            logging.warning(f"Error scanning directory {directory}: {e}")
+        dir_mtimes = []
+        # Iterative os.scandir walk: DirEntry type checks reuse the readdir
+        # file type, so plain files and directories cost no stat call.
+        # With FILES_FIEMAP_ORDER the pending directories form a heap keyed
+        # by their position on disk, which saves seeks on spinning disks.
+        by_disk_offset = config.FILES_FIEMAP_ORDER and _FIEMAP_SUPPORTED
+        stack = [(0, key)] if by_disk_offset else [key]
+        while stack:
+            path = heapq.heappop(stack)[1] if by_disk_offset else stack.pop()
+            try:
+                # Stat before listing so a change mid-walk invalidates the entry
+                dir_mtimes.append((path, os.stat(path).st_mtime_ns))
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if by_disk_offset:
+                                    heapq.heappush(stack, (_dir_fiemap_offset(entry.path), entry.path))
+                                else:
+                                    stack.append(entry.path)
+                            elif entry.is_file() and os.path.splitext(entry.name)[1].lower() in video_extensions:
+                                count += 1
+                        except OSError:
+                            # Skip entries we can't access
+                            pass
+            except OSError as e:
+                logging.warning(f"Error scanning directory {path}: {e}")
+
+        with self._video_count_lock:
+            self._video_count_cache[key] = (tuple(dir_mtimes), count)
         return count
 
     def _format_file_size(self, size_bytes: int) -> str:
         """Format file size in human readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} PB"
+        return _format_size(size_bytes)
 
     def _get_watch_progress_file(self) -> Path:
         """Get the path to the watch progress JSON file."""
@@ -3535,7 +4162,6 @@ class WebApp:
 
     def _load_watch_progress(self, progress_file: Path) -> dict:
         """Load watch progress from JSON file."""
-        import json
         if progress_file.exists():
             try:
                 with open(progress_file, 'r', encoding='utf-8') as f:
@@ -3547,7 +4173,6 @@ class WebApp:
 
     def _save_watch_progress(self, progress_file: Path, data: dict) -> None:
         """Save watch progress to JSON file."""
-        import json
         try:
             # Ensure parent directory exists
             progress_file.parent.mkdir(parents=True, exist_ok=True)
@@ -3569,26 +4194,76 @@ class WebApp:
 
     def _load_popular_cache(self) -> None:
         """Load the popular/new cache from disk into self._popular_cache."""
-        import json as _json
         cache_file = self._get_popular_cache_file()
         if cache_file.exists():
             try:
                 with open(cache_file, "r", encoding="utf-8") as f:
-                    self._popular_cache = _json.load(f)
+                    self._popular_cache = json.load(f)
             except Exception as e:
                 logging.error("Error loading popular cache: %s", e)
                 self._popular_cache = {}
 
     def _save_popular_cache(self) -> None:
         """Persist self._popular_cache to disk. Caller must hold _popular_cache_lock."""
-        import json as _json
         cache_file = self._get_popular_cache_file()
         try:
             with open(cache_file, "w", encoding="utf-8") as f:
-                _json.dump(self._popular_cache, f)
+                json.dump(self._popular_cache, f)
         except Exception as e:
             logging.error("Error saving popular cache: %s", e)
 
+    def _fetch_popular(self, key: str, fetch_fn) -> dict:
+        """Scrape popular/new content for ``key`` and cache it, joining a scrape already in flight."""
+        from datetime import date as _date
+
+        with self._popular_cache_lock:
+            future = self._popular_fetches.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._popular_fetches[key] = future
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            entry = {"data": fetch_fn(), "date": _date.today().isoformat()}
+            with self._popular_cache_lock:
+                self._popular_cache[key] = entry
+                self._save_popular_cache()
+        except Exception as exc:
+            with self._popular_cache_lock:
+                self._popular_fetches.pop(key, None)
+            future.set_exception(exc)
+            raise
+        with self._popular_cache_lock:
+            self._popular_fetches.pop(key, None)
+        future.set_result(entry)
+        return entry
+
+    def _refresh_popular(self, key: str, fetch_fn) -> None:
+        """Refresh a stale popular/new entry in the background."""
+        try:
+            self._fetch_popular(key, fetch_fn)
+        except Exception as exc:
+            logging.error("Background refresh of popular/new %s failed: %s", key, exc)
+
+    def _popular_response(self, key: str, entry: dict) -> Response:
+        """Build the popular/new response for a cache entry, encoding it once per entry.
+
+        Caller must hold _popular_cache_lock.
+        """
+        cached = self._popular_bodies.get(key)
+        if cached is None or cached[0] is not entry:
+            data = entry["data"]
+            body = _response_dumps({
+                "success": True,
+                "popular": data.get("popular", []),
+                "new": data.get("new", []),
+            })
+            cached = self._popular_bodies[key] = (entry, body)
+        return Response(cached[1], mimetype="application/json")
+
     def _start_popular_cache_warmup(self) -> None:
         """Load cached data from disk and refresh any stale provider in the background."""
         self._load_popular_cache()
@@ -3612,10 +4287,7 @@ class WebApp:
                         logging.info("Popular cache for %s is current, skipping fetch.", key)
                         continue
                 try:
-                    data = fetch_fn()
-                    with self._popular_cache_lock:
-                        self._popular_cache[key] = {"data": data, "date": today}
-                        self._save_popular_cache()
+                    self._fetch_popular(key, fetch_fn)
                     logging.info("Popular cache for %s refreshed.", key)
                 except Exception as exc:
                     logging.error("Popular cache warmup for %s failed: %s", key, exc)
@@ -3651,7 +4323,6 @@ class WebApp:
 
     def _load_subscriptions(self) -> list:
         """Load subscriptions list from JSON file."""
-        import json
         sub_file = self._get_subscriptions_file()
         if sub_file.exists():
             try:
@@ -3663,7 +4334,6 @@ class WebApp:
 
     def _save_subscriptions(self, subs: list) -> None:
         """Save subscriptions list to JSON file."""
-        import json
         sub_file = self._get_subscriptions_file()
         try:
             with open(sub_file, "w", encoding="utf-8") as f:
@@ -3675,7 +4345,6 @@ class WebApp:
         """Return total episode (+ movie) count for a series URL, or -1 on error."""
         try:
             from ..common import get_season_episode_count, get_movie_episode_count
-            from ..entry import _detect_site_from_url
             from .. import config as cfg
 
             if "/anime/stream/" in series_url:
@@ -3705,7 +4374,6 @@ class WebApp:
 
     def _check_subscriptions_once(self) -> None:
         """Check all subscriptions for new episodes and create notifications / trigger downloads."""
-        import json
         subs = self._load_subscriptions()
         changed = False
 
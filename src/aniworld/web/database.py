@@ -6,6 +6,7 @@ import hashlib
 import os
 import secrets
 import sqlite3
+import threading
 from typing import Optional, Dict, List
 from pathlib import Path
 
@@ -25,6 +26,24 @@ def get_database_path() -> str:
     return os.path.join(db_dir, "aniworld.db")
 
 
+_SESSION_USER_SQL = """
+    SELECT u.id, u.username, u.is_admin, u.is_original_admin
+    FROM users u
+    JOIN sessions s ON u.id = s.user_id
+    WHERE s.session_token = ? AND s.expires_at > CURRENT_TIMESTAMP
+"""
+
+
+def _session_user(row) -> Dict:
+    """Build the user dictionary returned by session lookups."""
+    return {
+        "id": row[0],
+        "username": row[1],
+        "is_admin": bool(row[2]),
+        "is_original_admin": bool(row[3]),
+    }
+
+
 class UserDatabase:
     """SQLite database manager for user authentication"""
 
@@ -36,6 +55,10 @@ class UserDatabase:
             db_path: Path to the SQLite database file (if None, uses system location)
         """
         self.db_path = db_path or get_database_path()
+        # Long-lived connection for session lookups, opened by prepare()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._session_cursor: Optional[sqlite3.Cursor] = None
+        self._conn_lock = threading.Lock()
         self._init_database()
 
     def _init_database(self) -> None:
@@ -225,30 +248,57 @@ class UserDatabase:
         try:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    SELECT u.id, u.username, u.is_admin, u.is_original_admin
-                    FROM users u
-                    JOIN sessions s ON u.id = s.user_id
-                    WHERE s.session_token = ? AND s.expires_at > CURRENT_TIMESTAMP
-                """,
-                    (session_token,),
-                )
+                cursor.execute(_SESSION_USER_SQL, (session_token,))
 
                 row = cursor.fetchone()
                 if row:
-                    return {
-                        "id": row[0],
-                        "username": row[1],
-                        "is_admin": bool(row[2]),
-                        "is_original_admin": bool(row[3]),
-                    }
+                    return _session_user(row)
 
                 return None
 
         except Exception:
             return None
 
+    def prepare(self) -> None:
+        """
+        Open the long-lived connection used by get_user_by_session_fast.
+
+        Session lookups run on every authenticated request. Keeping one
+        connection and cursor lets sqlite3 reuse its compiled statement
+        instead of connecting and re-preparing the query per call.
+        """
+        with self._conn_lock:
+            if self._conn is None:
+                self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+                self._session_cursor = self._conn.cursor()
+
+    def get_user_by_session_fast(self, session_token: str) -> Optional[Dict]:
+        """
+        Get user information by session token on the prepared connection.
+
+        Falls back to get_user_by_session if prepare() was not called.
+
+        Args:
+            session_token: Session token
+
+        Returns:
+            User dictionary if session is valid, None otherwise
+        """
+        if self._conn is None:
+            return self.get_user_by_session(session_token)
+
+        try:
+            with self._conn_lock:
+                # fetchall() steps the statement to completion so no read
+                # lock is held between requests
+                rows = self._session_cursor.execute(
+                    _SESSION_USER_SQL, (session_token,)
+                ).fetchall()
+        except Exception:
+            return None
+
+        return _session_user(rows[0]) if rows else None
+
     def delete_session(self, session_token: str) -> bool:
         """
         Delete a session (logout).
@@ -307,6 +357,40 @@ class UserDatabase:
         except Exception:
             return []
 
+    def get_user_by_id(self, user_id: int) -> Optional[Dict]:
+        """
+        Get a single user's admin flags by ID.
+
+        Args:
+            user_id: User ID to look up
+
+        Returns:
+            User dictionary if found, None otherwise
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    SELECT id, is_admin, is_original_admin
+                    FROM users WHERE id = ? LIMIT 1
+                """,
+                    (user_id,),
+                )
+
+                row = cursor.fetchone()
+                if row:
+                    return {
+                        "id": row[0],
+                        "is_admin": bool(row[1]),
+                        "is_original_admin": bool(row[2]),
+                    }
+
+                return None
+
+        except Exception:
+            return None
+
     def delete_user(self, user_id: int) -> bool:
         """
         Delete a user.
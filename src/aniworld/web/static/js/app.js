@@ -129,28 +129,7 @@ document.addEventListener('DOMContentLoaded', function() {
     if (window.loadContinueWatching) window.loadContinueWatching();
 
     // Load media library stats
-    fetch('/api/media-stats')
-        .then(r => r.json())
-        .then(stats => {
-            if (!stats || !stats.episodes) return;
-            const box = document.getElementById('media-stats-box');
-            const items = document.getElementById('media-stats-items');
-            if (!box || !items) return;
-            const rows = [
-                ['Series', stats.series],
-                ['Seasons', stats.seasons],
-                ['Episodes', stats.episodes],
-                ['Size', stats.size],
-            ];
-            items.innerHTML = rows.map(([label, val]) =>
-                `<div class="media-stat-row">
-                    <span class="media-stat-label">${label}</span>
-                    <span class="media-stat-value">${val}</span>
-                </div>`
-            ).join('');
-            box.style.display = 'block';
-        })
-        .catch(() => {});
+    loadMediaStats();
 
     // Initialize theme (default is dark mode)
     initializeTheme();
@@ -267,6 +246,36 @@ document.addEventListener('DOMContentLoaded', function() {
         });
     }
 
+    function loadMediaStats() {
+        fetch('/api/media-stats')
+            .then(r => r.json())
+            .then(stats => {
+                // The library scan runs in the background; poll until it is done
+                if (stats && !stats.scan_complete) {
+                    setTimeout(loadMediaStats, 2000);
+                    return;
+                }
+                if (!stats || !stats.episodes) return;
+                const box = document.getElementById('media-stats-box');
+                const items = document.getElementById('media-stats-items');
+                if (!box || !items) return;
+                const rows = [
+                    ['Series', stats.series],
+                    ['Seasons', stats.seasons],
+                    ['Episodes', stats.episodes],
+                    ['Size', stats.size],
+                ];
+                items.innerHTML = rows.map(([label, val]) =>
+                    `<div class="media-stat-row">
+                        <span class="media-stat-label">${label}</span>
+                        <span class="media-stat-value">${val}</span>
+                    </div>`
+                ).join('');
+                box.style.display = 'block';
+            })
+            .catch(() => {});
+    }
+
     function loadVersionInfo() {
         fetch('/api/info')
             .then(response => response.json())